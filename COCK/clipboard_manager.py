@@ -12,6 +12,7 @@ Features:
 - Auto-send functionality (for permissive mode)
 """
 
+import sys
 import time
 from typing import Optional
 
@@ -27,6 +28,13 @@ except ImportError:
     print("WARNING: pyperclip module not installed. Install with: pip install pyperclip")
     pyperclip = None
 
+# Direct Win32 clipboard access (used by ClipboardManager.clear)
+if sys.platform == 'win32':
+    import ctypes
+    _user32 = ctypes.windll.user32
+else:
+    _user32 = None
+
 
 class ClipboardManager:
     """
@@ -80,10 +88,17 @@ class ClipboardManager:
         
         return (True, content)
     
-    def capture_with_backup(self) -> str:
+    def capture_with_backup(self, max_len: Optional[int] = None) -> str:
         """
         Capture text from active window with clipboard restoration
         
+        Args:
+            max_len: Optional character cap. Longer captures are cut to
+                     max_len + 1 chars (so callers can still tell the cap
+                     was exceeded) before any further validation. This is
+                     only a post-read guard: pyperclip has no size-limited
+                     read, so the whole clipboard is still copied once.
+        
         Returns:
             str: Captured text from active window
         
@@ -133,6 +148,11 @@ class ClipboardManager:
             try:
                 captured_text = pyperclip.paste()
                 print(f"[CAPTURE] Clipboard now contains: {len(captured_text)} chars")
+                # Cut oversized captures before encoding/validating the whole thing
+                # (pyperclip.paste() has already read it all - it can't read less)
+                if max_len is not None and len(captured_text) > max_len:
+                    print(f"[CAPTURE] WARNING: Capture exceeds {max_len} chars, truncating")
+                    captured_text = captured_text[:max_len + 1]
             # Validate captured content
                 is_valid, captured_text = self._validate_clipboard_content(captured_text)
                 if not is_valid:
@@ -255,6 +275,26 @@ class ClipboardManager:
             print(f"Error copying to clipboard: {e}")
             return False
     
+    def clear(self) -> bool:
+        """
+        Empty the clipboard
+        
+        On Windows this is a single OpenClipboard/EmptyClipboard/CloseClipboard
+        round trip. Elsewhere, or if another process holds the clipboard
+        open, falls back to copying an empty string (pyperclip retries).
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if _user32 is not None and _user32.OpenClipboard(None):
+            try:
+                if _user32.EmptyClipboard():
+                    return True
+            finally:
+                _user32.CloseClipboard()
+        
+        return self.copy_to_clipboard("")
+    
     def get_clipboard(self) -> str:
         """
         Get current clipboard content
@@ -14,7 +14,7 @@ Features:
 
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Iterable, Tuple
 import path_manager
 import tempfile
 import shutil
@@ -29,6 +29,41 @@ def sanitize_path(file_path: str, base_dir: Optional[str] = None) -> str:
             raise ValueError(f"Path traversal detected: {file_path} outside {base_dir}")
     return abs_path
 
+# Choice validation
+def make_choice_validator(choices: Iterable[str], default: Any, name: str,
+                          case_sensitive: bool = True) -> Callable[[Any], Tuple[bool, Any, str]]:
+    """
+    Build a validator for a fixed set of allowed values
+    
+    The lookup table and error prefix are built once here, so each call
+    only pays for a dict lookup (plus formatting on a miss).
+    
+    Args:
+        choices: Allowed values
+        default: Value returned when validation fails
+        name: Setting name used in the error message
+        case_sensitive: If False, values are matched ignoring case
+        
+    Returns:
+        callable: validator(value) -> (is_valid, value_or_default, error)
+    """
+    choices = tuple(choices)
+    if case_sensitive:
+        lookup = {c: c for c in choices}
+    else:
+        lookup = {c.lower(): c for c in choices}
+    error_prefix = f"{name} must be one of {list(choices)}"
+    
+    def validator(value: Any) -> Tuple[bool, Any, str]:
+        key = value if case_sensitive or not isinstance(value, str) else value.lower()
+        try:
+            return (True, lookup[key], "")
+        except (KeyError, TypeError):
+            return (False, default, f"{error_prefix}, got: {value!r}")
+    
+    return validator
+
+
 # Default configuration template
 DEFAULT_CONFIG = {
     "version": "1.0",
@@ -97,6 +132,12 @@ DEFAULT_CONFIG = {
 }
 
 
+# Prebuilt validators for fixed-choice settings
+_V_MODE = make_choice_validator(("auto", "manual"), DEFAULT_CONFIG["detection_mode"],
+                                "detection_mode", case_sensitive=False)
+_V_THEME = make_choice_validator(("dark", "light"), DEFAULT_CONFIG["ui"]["theme"], "ui.theme")
+
+
 class ConfigLoader:
     """
     Configuration management class
@@ -115,6 +156,22 @@ class ConfigLoader:
         
         self.config_path = config_path
         self.config = None
+        
+        # File content and mtime as last read/written (see save)
+        self._last_text: Optional[str] = None
+        self._last_mtime: Optional[int] = None
+    
+    def _get_mtime(self) -> Optional[int]:
+        """
+        Get config file modification time
+        
+        Returns:
+            int: st_mtime_ns, or None if the file doesn't exist
+        """
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
     
     def load(self) -> Dict[str, Any]:
         """
@@ -141,8 +198,11 @@ class ConfigLoader:
         
         try:
             # Load existing config
+            mtime = self._get_mtime()
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                loaded_config = json.load(f)
+                text = f.read()
+            loaded_config = json.loads(text)
+            self._last_text, self._last_mtime = text, mtime
             
             # Merge with defaults to ensure all keys exist
             self.config = self._merge_with_defaults(loaded_config)
@@ -150,6 +210,9 @@ class ConfigLoader:
             # Sanitize file paths in config
             self._sanitize_config_paths()
             
+            # Old-format hotkeys ({"combo": ...}) -> plain strings
+            self._normalize_hotkeys()
+            
             return self.config
             
         except json.JSONDecodeError as e:
@@ -239,13 +302,22 @@ class ConfigLoader:
             return False
         
         try:
+            text = json.dumps(self.config, indent=4, ensure_ascii=False)
+            
+            # Skip the write if the file still holds exactly this content
+            if text == self._last_text and self._get_mtime() == self._last_mtime:
+                return True
+            
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             
-            # Write config
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            # Write to a temp file and swap it in, so a crash never leaves a torn config
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self.config_path)
             
+            self._last_text, self._last_mtime = text, self._get_mtime()
             return True
             
         except Exception as e:
@@ -319,18 +391,18 @@ class ConfigLoader:
             errors.append("filter_file is not set (required)")
         
         # Check detection mode
-        mode = self.config.get('detection_mode')
-        if mode not in ['strict', 'permissive']:
-            errors.append(f"Invalid detection_mode: {mode}")
+        valid, _, error = _V_MODE(self.config.get('detection_mode'))
+        if not valid:
+            errors.append(error)
         
-        # Check hotkey combo
-        if not self.config.get('hotkey', {}).get('combo'):
-            errors.append("hotkey.combo is not set")
+        # Check hotkey combo (normalized to a string by load())
+        if not self.config.get('hotkey'):
+            errors.append("hotkey is not set")
         
         # Check theme
-        theme = self.config.get('ui', {}).get('theme')
-        if theme not in ['dark', 'light']:
-            errors.append(f"Invalid ui.theme: {theme}")
+        valid, _, error = _V_THEME(self.config.get('ui', {}).get('theme'))
+        if not valid:
+            errors.append(error)
         
         return (len(errors) == 0, errors)
     
@@ -358,6 +430,13 @@ class ConfigLoader:
                         print(f"Warning: Invalid {key} path: {e}")
                         self.config['paths'][key] = ""
     
+    def _normalize_hotkeys(self) -> None:
+        """Convert old-format hotkey entries ({"combo": "..."}) to plain combo strings"""
+        for key in ('hotkey', 'force_optimize_hotkey', 'toggle_hotkeys_hotkey'):
+            value = self.config.get(key)
+            if isinstance(value, dict):
+                self.config[key] = value.get('combo') or DEFAULT_CONFIG[key]
+    
     def _merge_with_defaults(self, loaded_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge loaded config with defaults to ensure all keys exist
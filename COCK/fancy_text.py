@@ -174,6 +174,15 @@ class FancyTextConverter:
         ]
         self.default_style = default_style if default_style in self.styles else 'squared'
     
+    def set_style(self, style: str) -> None:
+        """
+        Change the default style in place
+        
+        Args:
+            style: New default style (unknown styles fall back to squared)
+        """
+        self.default_style = style if style in self.styles else 'squared'
+    
     def convert(self, text: str, style: str = None, positions: Optional[List[int]] = None) -> str:
         """
         Convert text to fancy Unicode
@@ -15,6 +15,7 @@ Algorithm Version: 4.0 (Production)
 """
 
 import re
+import sys
 from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -109,7 +110,8 @@ class FastCensorDetector:
             config: Configuration dictionary
         """
         self.automaton = automaton
-        self.whitelist = set(w.lower() for w in whitelist)
+        # Interned so lookups with interned tokens compare by identity
+        self.whitelist = set(sys.intern(w.lower()) for w in whitelist)
         self.config = config
         
         # Sliding window size for stripped detection
@@ -376,7 +378,8 @@ class FastCensorDetector:
         # (used to avoid duplicating in sliding window scan)
         found_words = set()
         
-        for end_idx, (idx, word) in self.automaton.iter(text.lower()):
+        text_lower = text.lower()
+        for end_idx, (idx, word) in self.automaton.iter(text_lower):
             # Create position-aware key (word at specific position)
             word_key = (word, end_idx)
             
@@ -403,13 +406,18 @@ class FastCensorDetector:
         words = self.extract_words(text)
         max_window = self.config.get('max_sliding_window', 3)
         
-        if len(words) >= 2:
+        # Every window is a run of consecutive words, i.e. a substring of all
+        # words joined together - if one pass over the join finds nothing,
+        # no window can match and the per-window scans are skipped
+        if len(words) >= 2 and next(self.automaton.iter(''.join(words).lower()), None) is not None:
             # Track detections with their window sizes for deduplication
             window_detections = []
             
+            # Lowercased once here instead of once per window the word appears in
+            words_lower = [w.lower() for w in words]
+            
             # Check all window sizes from 2 to min(word_count, max_window)
             for window_size in range(2, min(len(words), max_window) + 1):
-                text_lower = text.lower()
                 current_pos = 0
                 
                 # Build N-word sliding windows
@@ -420,7 +428,7 @@ class FastCensorDetector:
                     
                     for j in range(window_size):
                         word_idx = i + j
-                        word_start = text_lower.find(words[word_idx].lower(), search_pos)
+                        word_start = text_lower.find(words_lower[word_idx], search_pos)
                         if word_start == -1:
                             break
                         word_positions.append((word_start, words[word_idx]))
@@ -58,7 +58,8 @@ class MessageOptimizer:
         r'(?:http[s]?://|(?:www\.|[a-zA-Z0-9-]+\.(?:gg|com|net|org|io|tv|me|co)/))(?:[a-zA-Z]|[0-9]|[$-_@.&+/]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
     )
     
-    def __init__(self, detector, leet_converter, fancy_converter, shorthand_handler, config: Dict):
+    def __init__(self, detector, leet_converter, fancy_converter, shorthand_handler, config: Dict,
+                 debug: bool = False):
         """
         Initialize message optimizer
         
@@ -68,6 +69,7 @@ class MessageOptimizer:
             fancy_converter: FancyTextConverter instance
             shorthand_handler: ShorthandHandler instance
             config: Configuration dictionary
+            debug: Print special character interspacing trace lines
         """
         self.detector = detector
         self.leet = leet_converter
@@ -76,7 +78,7 @@ class MessageOptimizer:
         self.config = config
         
         # Initialize special character interspacing
-        self.special_char = special_char_interspacing.SpecialCharInterspacing(config)
+        self.special_char = special_char_interspacing.SpecialCharInterspacing(config, debug=debug)
         
         # Get optimization settings from config
         self.enable_leet = config.get('optimization', {}).get('leet_speak', True)
@@ -17,27 +17,64 @@ Usage:
     result = router.process_message("test message")
 """
 
-from typing import Dict, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Optional, List, Sequence
+from dataclasses import dataclass, fields
 from enum import Enum
+from collections import OrderedDict
+import threading
 import fast_detector
 
 
+# ProcessingResult.action values
+ACTION_SEND = 'send'
+ACTION_OPTIMIZE = 'optimize'
+ACTION_BLOCK = 'block'
+ACTION_MANUAL = 'manual'
+
+# Fixed explanations shared by several results
+EXPLANATION_CLEAN = "Message is clean"
+
+
 class DetectionMode(Enum):
     """Detection modes"""
     MANUAL = "manual"  # Renamed from STRICT - user reviews and chooses
     AUTO = "auto"      # Renamed from PERMISSIVE - automatic optimization
 
 
-@dataclass
+def _with_slots(cls):
+    """
+    Recreate a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)
+    
+    Args:
+        cls: Dataclass to convert
+    
+    Returns:
+        type: Equivalent class whose instances have no __dict__
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__; class attributes would clash with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+@_with_slots
+@dataclass(frozen=True)
 class ProcessingResult:
-    """Result of message processing"""
+    """Result of message processing (immutable - instances are shared via the router cache)"""
     mode: DetectionMode
     original: str
     suggested: Optional[str]
     should_show_ui: bool
-    flagged_words: List[str]
-    action: str  # 'send', 'optimize', 'block', 'manual'
+    flagged_words: Sequence[str]  # Shared empty tuple when nothing was flagged
+    action: str  # ACTION_SEND, ACTION_OPTIMIZE, ACTION_BLOCK or ACTION_MANUAL
     explanation: str
     paste_part: str = ""  # Remainder for multi-part messages (empty if all fits)
 
@@ -58,9 +95,16 @@ class ModeRouter:
             - Auto-send optimized version
             - Learning: Auto-update whitelist/blacklist from game feedback
             - UI only shown for failures
+    
+    process_message() results are memoized per (text, mode, detector, optimizer,
+    limits). Call update_config() after changing or reloading the config, and
+    clear_cache() after changing optimizer/detector attributes in place.
     """
     
-    def __init__(self, config: Dict, detector, optimizer, whitelist_manager):
+    # Maximum number of memoized process_message() results
+    CACHE_SIZE = 256
+    
+    def __init__(self, config: Dict, detector, optimizer, whitelist_manager, debug: bool = False):
         """
         Initialize mode router
         
@@ -69,8 +113,10 @@ class ModeRouter:
             detector: FastCensorDetector instance
             optimizer: MessageOptimizer instance
             whitelist_manager: WhitelistManager instance
+            debug: Print routing trace lines (see _log)
         """
         self.config = config
+        self.debug = debug
         self.detector = detector
         self.optimizer = optimizer
         self.whitelist = whitelist_manager
@@ -78,17 +124,145 @@ class ModeRouter:
         # Get mode from config
         mode_str = config.get('detection_mode', 'manual').lower()
         self.mode = DetectionMode.MANUAL if mode_str == 'manual' else DetectionMode.AUTO
+        self._is_manual = self.mode is DetectionMode.MANUAL  # Kept in sync by switch_mode
         
         # Get auto-send settings for auto mode
         auto_send_config = config.get('auto_send', {})
         self.auto_send_enabled = auto_send_config.get('enabled', False)
         self.auto_send_delay = auto_send_config.get('delay_ms', 100)
         self.auto_send_key = auto_send_config.get('key_combo', 'enter')
+        
+        # Message limits, snapshotted from config (see update_config)
+        self._byte_limit = config.get('byte_limit', 92)
+        self._char_limit = config.get('character_limit', 80)
+        self._exceeds_limits = self._build_length_gate(self._byte_limit, self._char_limit)
+        
+        # LRU cache of process_message() results (see clear_cache)
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_generation = 0  # Bumped by clear_cache() so in-flight results aren't stored
+        self._cache_lock = threading.Lock()
+    
+    def _log(self, message: str, *args):
+        """
+        Print a routing trace line in debug mode
+        
+        Nothing is formatted unless debug is on; extra args are %-formatted into message.
+        """
+        if not self.debug:
+            return
+        print(message % args if args else message)
+    
+    def clear_cache(self):
+        """Drop memoized results (call after settings change)"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+    
+    def update_config(self, config: Dict):
+        """
+        Adopt a changed or reloaded config
+        
+        Re-reads the snapshotted limits and drops memoized results.
+        
+        Args:
+            config: Configuration dictionary (may be the same dict, mutated)
+        """
+        self.config = config
+        self._byte_limit = config.get('byte_limit', 92)
+        self._char_limit = config.get('character_limit', 80)
+        self._exceeds_limits = self._build_length_gate(self._byte_limit, self._char_limit)
+        self.clear_cache()
+    
+    @staticmethod
+    def _build_length_gate(byte_limit: int, char_limit: int):
+        """
+        Build a length check specialized for the current limits
+        
+        Args:
+            byte_limit: UTF-8 byte limit (<= 0 disables)
+            char_limit: Character limit (<= 0 disables)
+        
+        Returns:
+            callable: text -> True if text exceeds either enabled limit
+        """
+        byte_limit = byte_limit if byte_limit > 0 else None
+        char_limit = char_limit if char_limit > 0 else None
+        
+        if byte_limit is None and char_limit is None:
+            return lambda text: False
+        
+        # ASCII text is one byte per char, so only the tighter limit matters
+        ascii_limit = min(limit for limit in (byte_limit, char_limit) if limit is not None)
+        
+        def exceeds(text: str) -> bool:
+            if text.isascii():
+                return len(text) > ascii_limit
+            if char_limit is not None and len(text) > char_limit:
+                return True
+            return byte_limit is not None and len(text.encode('utf-8')) > byte_limit
+        
+        return exceeds
+    
+    def _build_empty_result(self, text: str) -> ProcessingResult:
+        """
+        Build the clean result returned for empty/whitespace-only input
+        
+        Args:
+            text: The captured text, kept as the result's original
+        
+        Returns:
+            ProcessingResult: Clean 'send' result for the current mode
+        """
+        return ProcessingResult(
+            mode=self.mode,
+            original=text,
+            suggested=None,
+            should_show_ui=False,
+            flagged_words=(),
+            action=ACTION_SEND,
+            explanation=EXPLANATION_CLEAN,
+            paste_part=""
+        )
     
     def process_message(self, text: str) -> ProcessingResult:
         """
         Process message based on current mode
         
+        Repeated calls with the same text and settings return the cached result.
+        Empty or whitespace-only text skips detection entirely.
+        
+        Args:
+            text: Message to process
+        
+        Returns:
+            ProcessingResult with processing details and recommended action
+        """
+        # Nothing to detect in blank input (e.g. hotkey pressed on an empty chat box)
+        if not text or text.isspace():
+            return self._build_empty_result(text)
+        
+        # Detector/optimizer are keyed by identity, so swapping them invalidates entries
+        key = (text, self.mode, self.detector, self.optimizer, self._byte_limit, self._char_limit)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                return result
+            generation = self._cache_generation
+        
+        result = self._process_message_uncached(text)
+        
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[key] = result
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return result
+    
+    def _process_message_uncached(self, text: str) -> ProcessingResult:
+        """
+        Process message based on current mode (no caching)
+        
         Args:
             text: Message to process
         
@@ -98,25 +272,22 @@ class ModeRouter:
         # Detect issues
         detection = self.detector.detect_all(text)
         
+        # Unpacked once here and passed on to the mode handlers
+        original_text = detection.get('original_text', text)
+        collapsed_text = detection.get('collapsed_text', text)
+        collapse_mapping = detection.get('collapse_mapping')
+        
         if detection['clean']:
             # Message is clean - but check if it needs shorthand for length
-            original_text = detection.get('original_text', text)
-            collapsed_text = detection.get('collapsed_text', text)
-            
-            # Check if message exceeds limits
-            byte_limit = self.config.get('byte_limit', 92)
-            char_limit = self.config.get('character_limit', 80)
-            
-            exceeds_byte_limit = byte_limit > 0 and len(collapsed_text.encode('utf-8')) > byte_limit
-            exceeds_char_limit = char_limit > 0 and len(collapsed_text) > char_limit
-            
-            if exceeds_byte_limit or exceeds_char_limit:
+            # Check if message exceeds limits (gate is specialized in update_config)
+            if self._exceeds_limits(collapsed_text):
                 # Message too long - apply shorthand compression
-                print(f"[ROUTER] Clean message exceeds limits: {len(collapsed_text.encode('utf-8'))} bytes, {len(collapsed_text)} chars")
+                char_len = len(collapsed_text)
+                byte_len = char_len if collapsed_text.isascii() else len(collapsed_text.encode('utf-8'))
+                self._log("[ROUTER] Clean message exceeds limits: %d bytes, %d chars", byte_len, char_len)
                 
                 # Use optimizer to apply shorthand and enforce limits
                 # Pass collapse_mapping so optimizer knows which words were from collapse
-                collapse_mapping = detection.get('collapse_mapping')
                 optimization = self.optimizer.optimize(collapsed_text, collapse_mapping=collapse_mapping)
                 
                 if optimization.paste_part:
@@ -125,10 +296,10 @@ class ModeRouter:
                         mode=self.mode,
                         original=original_text,
                         suggested=optimization.optimized,
-                        should_show_ui=(self.mode == DetectionMode.MANUAL),
-                        flagged_words=[],
-                        action='manual' if self.mode == DetectionMode.MANUAL else 'optimize',
-                        explanation=f"Message shortened with shorthand (was {len(collapsed_text)} chars)",
+                        should_show_ui=self._is_manual,
+                        flagged_words=(),
+                        action=ACTION_MANUAL if self._is_manual else ACTION_OPTIMIZE,
+                        explanation=f"Message shortened with shorthand (was {char_len} chars)",
                         paste_part=optimization.paste_part
                     )
                 else:
@@ -138,9 +309,9 @@ class ModeRouter:
                         original=original_text,
                         suggested=optimization.optimized if optimization.optimized != collapsed_text else None,
                         should_show_ui=False,
-                        flagged_words=[],
-                        action='send',
-                        explanation=f"Message shortened with shorthand" if optimization.optimized != collapsed_text else "Message is clean",
+                        flagged_words=(),
+                        action=ACTION_SEND,
+                        explanation="Message shortened with shorthand" if optimization.optimized != collapsed_text else EXPLANATION_CLEAN,
                         paste_part=""
                     )
             
@@ -150,21 +321,22 @@ class ModeRouter:
                 original=text,
                 suggested=None,
                 should_show_ui=False,
-                flagged_words=[],
-                action='send',
-                explanation="Message is clean",
+                flagged_words=(),
+                action=ACTION_SEND,
+                explanation=EXPLANATION_CLEAN,
                 paste_part=""
             )
         
         # Message has filtered words - route to mode-specific handler
         flagged_words = [r.filtered_word for r in detection['flagged']]
         
-        if self.mode == DetectionMode.MANUAL:
-            return self._process_manual(text, flagged_words, detection)
+        if self._is_manual:
+            return self._process_manual(flagged_words, original_text, collapsed_text, collapse_mapping)
         else:  # AUTO mode
-            return self._process_auto(text, flagged_words, detection)
+            return self._process_auto(flagged_words, original_text, collapsed_text, collapse_mapping)
     
-    def _process_manual(self, text: str, flagged_words: List[str], detection: Dict) -> ProcessingResult:
+    def _process_manual(self, flagged_words: List[str], original_text: str, collapsed_text: str,
+                        collapse_mapping: Optional[List]) -> ProcessingResult:
         """
         Process in Manual mode (renamed from Strict mode)
         
@@ -182,18 +354,14 @@ class ModeRouter:
         Note: Works on COLLAPSED text (spaced patterns are collapsed)
         
         Args:
-            text: Original message
             flagged_words: List of flagged words
-            detection: Detection results
+            original_text: Message before collapsing
+            collapsed_text: Message with spaced patterns collapsed
+            collapse_mapping: Collapse mapping from detection
         
         Returns:
             ProcessingResult for manual mode
         """
-        # Get collapsed text from detection
-        original_text = detection.get('original_text', text)
-        collapsed_text = detection.get('collapsed_text', text)
-        collapse_mapping = detection.get('collapse_mapping')
-        
         # Generate optimization suggestions using collapsed text
         # Pass collapse_mapping so optimizer knows which words were from collapse (whitelist override)
         optimization = self.optimizer.optimize(collapsed_text, collapse_mapping=collapse_mapping)
@@ -220,12 +388,13 @@ class ModeRouter:
             suggested=optimization.optimized if show_suggestion else None,
             should_show_ui=True,
             flagged_words=flagged_words,
-            action='manual',
+            action=ACTION_MANUAL,
             explanation=explanation,
             paste_part=optimization.paste_part if show_suggestion else ""
         )
     
-    def _process_auto(self, text: str, flagged_words: List[str], detection: Dict) -> ProcessingResult:
+    def _process_auto(self, flagged_words: List[str], original_text: str, collapsed_text: str,
+                      collapse_mapping: Optional[List]) -> ProcessingResult:
         """
         Process in Auto mode (replaces Permissive mode)
         
@@ -239,120 +408,174 @@ class ModeRouter:
         become "motherfuck" in output - spacing NOT preserved for collapsed patterns)
         
         Args:
-            text: Original message
             flagged_words: List of flagged words
-            detection: Detection results
+            original_text: Message before collapsing
+            collapsed_text: Message with spaced patterns collapsed (this is what we'll optimize)
+            collapse_mapping: Collapse mapping from detection
         
         Returns:
             ProcessingResult for auto mode
         """
-        # Get collapsed text from detection (this is what we'll optimize)
-        original_text = detection.get('original_text', text)
-        collapsed_text = detection.get('collapsed_text', text)
-        
-        print(f"\n[AUTO] ========== Processing: '{original_text}' ==========")
+        self._log("\n[AUTO] ========== Processing: '%s' ==========", original_text)
         
         if not flagged_words:
             # Clean message - send collapsed version
-            print(f"[AUTO] → Action: SEND (clean)")
+            self._log("[AUTO] → Action: SEND (clean)")
             return ProcessingResult(
                 mode=DetectionMode.AUTO,
                 original=original_text,
                 suggested=collapsed_text,  # Send collapsed version
                 should_show_ui=False,
-                flagged_words=[],
-                action='send',
-                explanation="Message is clean",
+                flagged_words=(),
+                action=ACTION_SEND,
+                explanation=EXPLANATION_CLEAN,
                 paste_part=""
             )
         
         # Optimize using COLLAPSED text (simpler, no position mapping needed)
-        print(f"[AUTO] Detected: {flagged_words}")
-        print(f"[AUTO] Calling optimizer on collapsed text...")
+        self._log("[AUTO] Detected: %s", flagged_words)
+        self._log("[AUTO] Calling optimizer on collapsed text...")
         
         # Pass collapse_mapping so optimizer knows which words were from collapse (whitelist override)
-        collapse_mapping = detection.get('collapse_mapping')
         optimization = self.optimizer.optimize(collapsed_text, collapse_mapping=collapse_mapping)
-        print(f"[AUTO] Optimization result: success={optimization.success}, optimized='{optimization.optimized}'")
+        self._log("[AUTO] Optimization result: success=%s, optimized='%s'", optimization.success, optimization.optimized)
         
-        if optimization.success:
-            print(f"[AUTO] → Action: OPTIMIZE (auto-send, NO prompt)")
-            
-            # Build explanation
-            explanation = f"Auto-optimized all detected words"
-            if optimization.links_modified:
-                explanation += " (⚠️ Link modified)"
-                print(f"[AUTO] WARNING: Numeral words in links were modified!")
-            
-            if optimization.paste_part:
-                print(f"[AUTO] Multi-part message: paste_part has {len(optimization.paste_part)} chars")
-            
-            return ProcessingResult(
-                mode=DetectionMode.AUTO,
-                original=original_text,
-                suggested=optimization.optimized,  # Send portion
-                should_show_ui=False,  # No prompts in auto mode
-                flagged_words=flagged_words,
-                action='optimize',
-                explanation=explanation,
-                paste_part=optimization.paste_part  # Remainder for multi-part
-            )
+        # Dispatch on (success, has paste part, partial) - success wins, then split, then partial
+        state = ((bool(optimization.success) << 2)
+                 | (bool(optimization.paste_part) << 1)
+                 | bool(optimization.partial_optimization))
+        return self._AUTO_HANDLERS[state](self, flagged_words, original_text, optimization)
+    
+    def _auto_optimized(self, flagged_words: List[str], original_text: str, optimization) -> ProcessingResult:
+        """
+        Auto mode result when optimization fully succeeded
         
-        # Optimization not fully successful - check if partial optimization or split available
-        elif optimization.paste_part:
-            # Message was split - send the split portion
-            print(f"[AUTO] → Action: SEND_SPLIT (message split due to length)")
-            print(f"[AUTO] Sending {len(optimization.optimized)} chars, pasting {len(optimization.paste_part)} chars")
-            
-            explanation = "Message split due to length limits"
-            if optimization.partial_optimization:
-                explanation += " (partial optimization applied)"
-            
-            return ProcessingResult(
-                mode=DetectionMode.AUTO,
-                original=original_text,
-                suggested=optimization.optimized,  # Use split portion
-                should_show_ui=False,
-                flagged_words=flagged_words,
-                action='optimize',
-                explanation=explanation,
-                paste_part=optimization.paste_part
-            )
+        Args:
+            flagged_words: List of flagged words
+            original_text: Message before collapsing
+            optimization: OptimizationResult from the optimizer
         
-        elif optimization.partial_optimization:
-            # Partial optimization succeeded - send it
-            print(f"[AUTO] → Action: PARTIAL_OPTIMIZE (some words optimized)")
-            print(f"[AUTO] Reduced flagged words, sending partial optimization")
-            
-            explanation = "Partial optimization applied"
-            if optimization.links_modified:
-                explanation += " (URLs protected)"
-                print(f"[AUTO] Some filtered words remain in protected URLs")
-            
-            return ProcessingResult(
-                mode=DetectionMode.AUTO,
-                original=original_text,
-                suggested=optimization.optimized,
-                should_show_ui=False,
-                flagged_words=flagged_words,
-                action='optimize',  # Send the partial optimization
-                explanation=explanation,
-                paste_part=""
-            )
+        Returns:
+            ProcessingResult that auto-sends the optimized text
+        """
+        self._log("[AUTO] → Action: OPTIMIZE (auto-send, NO prompt)")
         
-        else:
-            # No optimization, no split, no partial - block
-            print(f"[AUTO] → Action: BLOCK (optimization failed completely)")
-            return ProcessingResult(
-                mode=DetectionMode.AUTO,
-                original=original_text,
-                suggested=optimization.optimized,
-                should_show_ui=False,
-                flagged_words=flagged_words,
-                action='block',
-                explanation="Could not optimize message",
-                paste_part=""
-            )
+        # Build explanation
+        explanation = "Auto-optimized all detected words"
+        if optimization.links_modified:
+            explanation += " (⚠️ Link modified)"
+            self._log("[AUTO] WARNING: Numeral words in links were modified!")
+        
+        if optimization.paste_part:
+            self._log("[AUTO] Multi-part message: paste_part has %d chars", len(optimization.paste_part))
+        
+        return ProcessingResult(
+            mode=DetectionMode.AUTO,
+            original=original_text,
+            suggested=optimization.optimized,  # Send portion
+            should_show_ui=False,  # No prompts in auto mode
+            flagged_words=flagged_words,
+            action=ACTION_OPTIMIZE,
+            explanation=explanation,
+            paste_part=optimization.paste_part  # Remainder for multi-part
+        )
+    
+    def _auto_split(self, flagged_words: List[str], original_text: str, optimization) -> ProcessingResult:
+        """
+        Auto mode result when optimization failed but the message was split
+        
+        Args:
+            flagged_words: List of flagged words
+            original_text: Message before collapsing
+            optimization: OptimizationResult from the optimizer
+        
+        Returns:
+            ProcessingResult that sends the split portion
+        """
+        self._log("[AUTO] → Action: SEND_SPLIT (message split due to length)")
+        self._log("[AUTO] Sending %d chars, pasting %d chars", len(optimization.optimized), len(optimization.paste_part))
+        
+        explanation = "Message split due to length limits"
+        if optimization.partial_optimization:
+            explanation += " (partial optimization applied)"
+        
+        return ProcessingResult(
+            mode=DetectionMode.AUTO,
+            original=original_text,
+            suggested=optimization.optimized,  # Use split portion
+            should_show_ui=False,
+            flagged_words=flagged_words,
+            action=ACTION_OPTIMIZE,
+            explanation=explanation,
+            paste_part=optimization.paste_part
+        )
+    
+    def _auto_partial(self, flagged_words: List[str], original_text: str, optimization) -> ProcessingResult:
+        """
+        Auto mode result when only some words could be optimized
+        
+        Args:
+            flagged_words: List of flagged words
+            original_text: Message before collapsing
+            optimization: OptimizationResult from the optimizer
+        
+        Returns:
+            ProcessingResult that sends the partial optimization
+        """
+        self._log("[AUTO] → Action: PARTIAL_OPTIMIZE (some words optimized)")
+        self._log("[AUTO] Reduced flagged words, sending partial optimization")
+        
+        explanation = "Partial optimization applied"
+        if optimization.links_modified:
+            explanation += " (URLs protected)"
+            self._log("[AUTO] Some filtered words remain in protected URLs")
+        
+        return ProcessingResult(
+            mode=DetectionMode.AUTO,
+            original=original_text,
+            suggested=optimization.optimized,
+            should_show_ui=False,
+            flagged_words=flagged_words,
+            action=ACTION_OPTIMIZE,  # Send the partial optimization
+            explanation=explanation,
+            paste_part=""
+        )
+    
+    def _auto_block(self, flagged_words: List[str], original_text: str, optimization) -> ProcessingResult:
+        """
+        Auto mode result when optimization failed completely
+        
+        Args:
+            flagged_words: List of flagged words
+            original_text: Message before collapsing
+            optimization: OptimizationResult from the optimizer
+        
+        Returns:
+            ProcessingResult that blocks the send
+        """
+        self._log("[AUTO] → Action: BLOCK (optimization failed completely)")
+        return ProcessingResult(
+            mode=DetectionMode.AUTO,
+            original=original_text,
+            suggested=optimization.optimized,
+            should_show_ui=False,
+            flagged_words=flagged_words,
+            action=ACTION_BLOCK,
+            explanation="Could not optimize message",
+            paste_part=""
+        )
+    
+    # Indexed by (success << 2) | (has_paste_part << 1) | partial_optimization
+    _AUTO_HANDLERS = (
+        _auto_block,      # 000
+        _auto_partial,    # 001
+        _auto_split,      # 010
+        _auto_split,      # 011 (split wins over partial)
+        _auto_optimized,  # 100
+        _auto_optimized,  # 101
+        _auto_optimized,  # 110
+        _auto_optimized,  # 111
+    )
     
     def process_force_optimize(self, text: str) -> ProcessingResult:
         """
@@ -371,7 +594,7 @@ class ModeRouter:
         Returns:
             ProcessingResult with force-optimized text
         """
-        print(f"[FORCE] ========== Force Optimizing: '{text}' ==========")
+        self._log("[FORCE] ========== Force Optimizing: '%s' ==========", text)
         
         # Collapse spaced patterns
         collapsed_text = self.detector.collapse_spaced_patterns(text)
@@ -379,20 +602,20 @@ class ModeRouter:
         # Force optimize ALL words
         optimized = self.optimizer.force_optimize_all(collapsed_text)
         
-        # Enforce limits (may split into parts)
-        send_part, paste_part, stages = self.optimizer.enforce_limits(optimized, links=[], stages_applied=['force_optimize'], )
+        # Enforce limits (may split into parts); no links to restore, stage list unused
+        send_part, paste_part, _ = self.optimizer.enforce_limits(optimized)
         
-        print(f"[FORCE] Optimization complete: '{send_part}'")
+        self._log("[FORCE] Optimization complete: '%s'", send_part)
         if paste_part:
-            print(f"[FORCE] Multi-part: remainder '{paste_part}' will be pasted")
+            self._log("[FORCE] Multi-part: remainder '%s' will be pasted", paste_part)
         
         return ProcessingResult(
             mode=self.mode,
             original=text,
             suggested=send_part,
             should_show_ui=False,
-            flagged_words=[],
-            action='optimize',
+            flagged_words=(),
+            action=ACTION_OPTIMIZE,
             explanation="Force optimized all words",
             paste_part=paste_part
         )
@@ -405,6 +628,7 @@ class ModeRouter:
             new_mode: New detection mode
         """
         self.mode = new_mode
+        self._is_manual = new_mode is DetectionMode.MANUAL
         
         # Update config
         self.config['detection_mode'] = new_mode.value
@@ -418,13 +642,17 @@ class ModeRouter:
         """
         return self.mode
     
-    def is_strict(self) -> bool:
-        """Check if in strict mode"""
-        return self.mode == DetectionMode.STRICT
+    def is_manual(self) -> bool:
+        """Check if in manual mode"""
+        return self._is_manual
+    
+    def is_auto(self) -> bool:
+        """Check if in auto mode"""
+        return not self._is_manual
     
-    def is_permissive(self) -> bool:
-        """Check if in permissive mode"""
-        return self.mode == DetectionMode.PERMISSIVE
+    # Old names (Strict -> Manual, Permissive -> Auto)
+    is_strict = is_manual
+    is_permissive = is_auto
     
     def get_stats(self) -> Dict:
         """
@@ -79,52 +79,23 @@ if PYQT5_AVAILABLE:
         
         def init_ui(self):
             """Initialize the user interface"""
-            # Get scaling factor
-            scale = self.config.get('ui', {}).get('prompt_scale', 1.0)
-            
-            # Calculate scaled font sizes
-            base_font_size = 9  # Qt default
-            scaled_font_size = int(base_font_size * scale)
-            title_font_size = int(12 * scale)
-            
             # Window properties
             self.setWindowTitle("COCK Profanity Processor - Detection")
             self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
             
-            # Apply scaling to all elements
-            self.setMinimumWidth(int(450 * scale))
-            self.setMaximumWidth(int(600 * scale))
-            
             # Main layout
             layout = QVBoxLayout()
-            layout.setSpacing(int(12 * scale))
-            layout.setContentsMargins(
-                int(16 * scale), 
-                int(16 * scale), 
-                int(16 * scale), 
-                int(16 * scale)
-            )
-            
-            # Create scaled font for all text elements
-            text_font = QFont()
-            text_font.setPointSize(scaled_font_size)
+            self.main_layout = layout
             
             # Title
-            title = QLabel("⚠ Filtered Words Detected")
-            title_font = QFont()
-            title_font.setPointSize(title_font_size)
-            title_font.setBold(True)
-            title.setFont(title_font)
-            layout.addWidget(title)
+            self.title_label = QLabel("⚠ Filtered Words Detected")
+            layout.addWidget(self.title_label)
             
             # Detected words section
             words_group = QGroupBox("Detected Words")
-            words_group.setFont(text_font)  # Scale group box title
             words_layout = QVBoxLayout()
             
             self.words_list = QListWidget()
-            self.words_list.setFont(text_font)  # Scale list items
-            self.words_list.setMaximumHeight(int(150 * scale))
             words_layout.addWidget(self.words_list)
             
             words_group.setLayout(words_layout)
@@ -132,13 +103,10 @@ if PYQT5_AVAILABLE:
             
             # Original message section
             original_group = QGroupBox("Original Message")
-            original_group.setFont(text_font)  # Scale group box title
             original_layout = QVBoxLayout()
             
             self.original_label = QLabel()
-            self.original_label.setFont(text_font)  # Scale message text
             self.original_label.setWordWrap(True)
-            self.original_label.setMaximumHeight(int(80 * scale))
             original_layout.addWidget(self.original_label)
             
             original_group.setLayout(original_layout)
@@ -146,35 +114,14 @@ if PYQT5_AVAILABLE:
             
             # Suggestion section
             suggestion_group = QGroupBox("Suggested Optimization")
-            suggestion_group.setFont(text_font)  # Scale group box title
             suggestion_layout = QVBoxLayout()
             
             self.suggestion_label = QLabel()
-            self.suggestion_label.setFont(text_font)  # Scale suggestion text
             self.suggestion_label.setWordWrap(True)
-            self.suggestion_label.setMaximumHeight(int(80 * scale))
             suggestion_layout.addWidget(self.suggestion_label)
             
             self.copy_btn = QPushButton("📋 Copy to Clipboard")
-            self.copy_btn.setFont(text_font)  # Scale button text
-            self.copy_btn.setMinimumHeight(int(32 * scale))  # Scale button height
             self.copy_btn.clicked.connect(self.copy_suggestion)
-            self.copy_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #2196F3;
-                color: white;
-                padding: {int(8 * scale)}px;
-                border-radius: 4px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #1976D2;
-            }}
-            QPushButton:disabled {{
-                background-color: #BDBDBD;
-                color: #757575;
-            }}
-            """)
             suggestion_layout.addWidget(self.copy_btn)
             
             suggestion_group.setLayout(suggestion_layout)
@@ -184,55 +131,100 @@ if PYQT5_AVAILABLE:
             button_layout = QHBoxLayout()
             
             self.use_btn = QPushButton("✓ Use Suggestion")
-            self.use_btn.setFont(text_font)  # Scale button text
-            self.use_btn.setMinimumHeight(int(40 * scale))  # Scale button height
             self.use_btn.clicked.connect(self.on_use_suggestion)
-            self.use_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #4CAF50;
-                color: white;
-                padding: {int(8 * scale)}px;
-                border-radius: 4px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #45a049;
-            }}
-            QPushButton:disabled {{
-                background-color: #BDBDBD;
-                color: #757575;
-            }}
-            """)
             button_layout.addWidget(self.use_btn)
             
             self.cancel_btn = QPushButton("✗ Cancel")
-            self.cancel_btn.setFont(text_font)  # Scale button text
-            self.cancel_btn.setMinimumHeight(int(40 * scale))  # Scale button height
             self.cancel_btn.clicked.connect(self.on_cancel)
-            self.cancel_btn.setStyleSheet(f"""
+            button_layout.addWidget(self.cancel_btn)
+            
+            layout.addLayout(button_layout)
+            
+            self.setLayout(layout)
+            
+            self.group_boxes = (words_group, original_group, suggestion_group)
+            
+            # Apply scaling to all elements
+            self.apply_scale(self.config.get('ui', {}).get('prompt_scale', 1.0))
+            
+            # Apply theme
+            self.apply_theme()
+        
+        def apply_scale(self, scale: float):
+            """
+            Apply prompt scale to fonts and sizes in place
+            
+            Widgets and signal connections are kept, so this can be called
+            again whenever the prompt scale setting changes.
+            
+            Args:
+                scale: Prompt scale factor (1.0 = default)
+            """
+            # Calculate scaled font sizes
+            base_font_size = 9  # Qt default
+            scaled_font_size = int(base_font_size * scale)
+            title_font_size = int(12 * scale)
+            
+            self.setMinimumWidth(int(450 * scale))
+            self.setMaximumWidth(int(600 * scale))
+            
+            self.main_layout.setSpacing(int(12 * scale))
+            self.main_layout.setContentsMargins(
+                int(16 * scale), 
+                int(16 * scale), 
+                int(16 * scale), 
+                int(16 * scale)
+            )
+            
+            # Create scaled font for all text elements
+            text_font = QFont()
+            text_font.setPointSize(scaled_font_size)
+            
+            # Title
+            title_font = QFont()
+            title_font.setPointSize(title_font_size)
+            title_font.setBold(True)
+            self.title_label.setFont(title_font)
+            
+            # Scale group box titles
+            for group in self.group_boxes:
+                group.setFont(text_font)
+            
+            self.words_list.setFont(text_font)  # Scale list items
+            self.words_list.setMaximumHeight(int(150 * scale))
+            
+            self.original_label.setFont(text_font)  # Scale message text
+            self.original_label.setMaximumHeight(int(80 * scale))
+            
+            self.suggestion_label.setFont(text_font)  # Scale suggestion text
+            self.suggestion_label.setMaximumHeight(int(80 * scale))
+            
+            # Buttons: (button, min height, color, hover color)
+            for button, min_height, color, hover in (
+                (self.copy_btn, 32, '#2196F3', '#1976D2'),
+                (self.use_btn, 40, '#4CAF50', '#45a049'),
+                (self.cancel_btn, 40, '#f44336', '#C6372D'),
+            ):
+                button.setFont(text_font)  # Scale button text
+                button.setMinimumHeight(int(min_height * scale))  # Scale button height
+                button.setStyleSheet(f"""
             QPushButton {{
-                background-color: #f44336;
+                background-color: {color};
                 color: white;
                 padding: {int(8 * scale)}px;
                 border-radius: 4px;
                 font-weight: bold;
             }}
             QPushButton:hover {{
-                background-color: #C6372D;
+                background-color: {hover};
             }}
             QPushButton:disabled {{
                 background-color: #BDBDBD;
                 color: #757575;
             }}
             """)
-            button_layout.addWidget(self.cancel_btn)
             
-            layout.addLayout(button_layout)
-            
-            self.setLayout(layout)
-            
-            # Apply theme
-            self.apply_theme()
+            self.adjustSize()
 
         def on_copy_clicked(self):
             """Handle copy button click"""
@@ -491,6 +483,9 @@ else:
         def __init__(self, config):
             self.config = config
         
+        def apply_scale(self, scale):
+            pass
+        
         def show_detection(self, original, flagged_words, suggested=None):
             print(f"[Manual Mode Overlay - PyQt5 not available]")
             print(f"Original: {original}")
@@ -14,6 +14,27 @@ Features:
 
 import sys
 import os
+from functools import lru_cache
+
+
+# Resolved once at import - none of these change during the process lifetime
+_FROZEN = getattr(sys, 'frozen', False)
+
+if _FROZEN:
+    # Running as compiled .exe
+    # sys.executable is the path to the .exe
+    _APP_DIR = os.path.dirname(os.path.abspath(sys.executable))
+    # PyInstaller's temporary extraction folder
+    _BUNDLE_DIR = sys._MEIPASS
+else:
+    # Running as Python script
+    # __file__ is cct/path_manager.py
+    # Go up TWO levels to get to project root
+    _APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    _BUNDLE_DIR = _APP_DIR
+
+# get_resource_file() results, keyed by the requested name
+_resource_cache = {}
 
 
 def get_app_dir():
@@ -27,17 +48,7 @@ def get_app_dir():
         - Development: Project root directory (parent of cct/ folder)
         - .exe: Directory containing the .exe file
     """
-    if getattr(sys, 'frozen', False):
-        # Running as compiled .exe
-        # sys.executable is the path to the .exe
-        return os.path.dirname(sys.executable)
-    else:
-        # Running as Python script
-        # __file__ is cct/path_manager.py
-        # Go up TWO levels to get to project root
-        module_dir = os.path.dirname(os.path.abspath(__file__))  # cct/
-        project_root = os.path.dirname(module_dir)                # project root
-        return project_root
+    return _APP_DIR
 
 
 def get_data_file(filename):
@@ -69,21 +80,16 @@ def get_data_file(filename):
     if os.path.isabs(filename):
         raise ValueError(f"Invalid filename: '{filename}' - absolute paths not allowed")
     
-    # Build path
-    base_dir = get_app_dir()
-    full_path = os.path.join(base_dir, filename)
-    
-    # Double-check: Verify final path is within base_dir (defense in depth)
-    abs_base = os.path.abspath(base_dir)
-    abs_full = os.path.abspath(full_path)
-    
-    # Ensure path starts with base_dir + separator
-    if not abs_full.startswith(abs_base + os.sep):
+    # No drive prefixes ('C:name' is drive-relative on Windows) or bare '.'
+    if os.path.splitdrive(filename)[0] or filename == '.':
         raise ValueError(f"Path traversal detected: '{filename}'")
     
-    return full_path
+    # The checks above leave a single plain name, so joining it to the
+    # (already absolute) app dir always yields a direct child - no abspath needed
+    return os.path.join(_APP_DIR, filename)
 
 
+@lru_cache(maxsize=128)
 def get_bundled_resource(filename):
     """
     Get path to bundled resource
@@ -103,14 +109,8 @@ def get_bundled_resource(filename):
         - Icon files
         - Other files bundled into the .exe
     """
-    if getattr(sys, 'frozen', False):
-        # Running as .exe - use PyInstaller's temporary extraction folder
-        base_path = sys._MEIPASS
-    else:
-        # Running as script - use project root (not cct/ folder)
-        base_path = get_app_dir()
-    
-    return os.path.join(base_path, filename)
+    # .exe: PyInstaller's extraction folder, script: project root (not cct/ folder)
+    return os.path.join(_BUNDLE_DIR, filename)
 
 
 def ensure_data_directory():
@@ -123,11 +123,12 @@ def ensure_data_directory():
     Note:
         Creates the directory if it doesn't exist
     """
-    data_dir = get_app_dir()
+    data_dir = _APP_DIR
     os.makedirs(data_dir, exist_ok=True)
     return data_dir
 
 
+@lru_cache(maxsize=None)
 def get_default_filter_path():
     """
     Get the default filter file path
@@ -158,27 +159,35 @@ def get_resource_file(filename):
     Args:
         filename (str): Relative path within resources/ folder
                        (e.g., 'icons/icon.ico' or 'splash/splash_1.png')
+    
+    Resolved paths are cached; a name whose file wasn't found is probed again next time.
     """
+    cached = _resource_cache.get(filename)
+    if cached is not None:
+        return cached
+    
     # Security validation: Allow / for subdirectories but no ..
     if '..' in filename:
         raise ValueError(f"Invalid resource path: '{filename}' - parent references not allowed")
     
     # Convert to OS-specific path
-    filename = filename.replace('/', os.sep)
-    if getattr(sys, 'frozen', False):
+    relative = filename.replace('/', os.sep)
+    if _FROZEN:
         # Running as .exe - use PyInstaller's temporary extraction folder
-        base_path = sys._MEIPASS
-        return os.path.join(base_path, 'resources', filename)
+        path = os.path.join(_BUNDLE_DIR, 'resources', relative)
+        _resource_cache[filename] = path
+        return path
     else:
         # Running as script - try different possible locations
-        app_dir = get_app_dir()  # Now returns project root
+        app_dir = _APP_DIR  # Project root
         possible_paths = [
-            os.path.join(app_dir, 'resources', filename),
-            os.path.join(os.getcwd(), 'resources', filename),
+            os.path.join(app_dir, 'resources', relative),
+            os.path.join(os.getcwd(), 'resources', relative),
         ]
         
         for path in possible_paths:
             if os.path.exists(path):
+                _resource_cache[filename] = path
                 return path
         
         # Return first path as fallback (will fail gracefully in calling code)
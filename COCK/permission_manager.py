@@ -13,14 +13,50 @@ Features:
 
 import sys
 import os
-import ctypes
-from typing import Dict, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Iterator, NamedTuple, Optional, Tuple
 
 
+# Resolved once at import - sys.platform never changes at runtime
+_IS_WINDOWS = sys.platform == 'win32'
+_IS_MACOS = sys.platform == 'darwin'
+_IS_LINUX = sys.platform.startswith('linux')
+_PLATFORM_NAME = ('Windows' if _IS_WINDOWS else
+                  'macOS' if _IS_MACOS else
+                  'Linux' if _IS_LINUX else
+                  sys.platform)
+
+
+class PermissionStatus(NamedTuple):
+    """Result of a single permission check"""
+    granted: bool
+    message: str
+
+
+@dataclass
+class Permissions:
+    """Results of all permission checks"""
+    __slots__ = ('keyboard', 'clipboard', 'admin')
+    
+    keyboard: PermissionStatus
+    clipboard: PermissionStatus
+    admin: PermissionStatus
+    
+    def items(self) -> Iterator[Tuple[str, PermissionStatus]]:
+        """Iterate (name, status) pairs in check order"""
+        for name in self.__slots__:
+            yield name, getattr(self, name)
+
+
+@lru_cache(maxsize=1)
 def is_admin():
     """
     Check if running with administrator privileges
     
+    Cached: elevation can't change within a process (elevating relaunches it).
+    
     Returns:
         bool: True if running as admin, False otherwise
         
@@ -29,8 +65,9 @@ def is_admin():
         - Linux/macOS: Checks if effective UID is 0 (root)
     """
     try:
-        if sys.platform == 'win32':
-            # Windows: Check if user is admin
+        if _IS_WINDOWS:
+            # Windows: Check if user is admin (ctypes only imported where used)
+            import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         else:
             # Unix-like: Check if running as root
@@ -55,13 +92,15 @@ def request_admin_privileges():
         On Windows, this will restart the application if elevation is granted.
         The current process will exit.
     """
-    if sys.platform != 'win32':
+    if not _IS_WINDOWS:
         return False
     
     if is_admin():
         # Already running as admin
         return True
     
+    import ctypes
+    
     try:
         # Get the path to the current executable or script
         if getattr(sys, 'frozen', False):
@@ -100,58 +139,104 @@ def request_admin_privileges():
         return False
 
 
-def check_permissions() -> Dict[str, Tuple[bool, str]]:
+def check_permissions() -> Permissions:
     """
     Check all required permissions for the application
     
+    The probes run once per process (see _probe_permissions); each call
+    returns a fresh copy of the cached results.
+    
     Returns:
-        dict: Dictionary of permission checks
-            {
-                'keyboard': (bool, str),  # (has_permission, message)
-                'clipboard': (bool, str),
-                'admin': (bool, str)
-            }
+        Permissions: keyboard, clipboard and admin PermissionStatus
+            (granted: bool, message: str) results
+    """
+    return replace(_probe_permissions())
+
+
+@lru_cache(maxsize=1)
+def _probe_permissions() -> Permissions:
     """
-    results = {}
+    Run the permission probes (module availability, admin check)
+    
+    keyboard and pyperclip are located with find_spec rather than imported,
+    so their import-time setup isn't paid here. Use check_clipboard_runtime()
+    for a real clipboard read.
     
+    Call _probe_permissions.cache_clear() to force a re-probe.
+    
+    Returns:
+        Permissions: Probe results
+    """
     # Keyboard access check
-    try:
-        import keyboard
-        results['keyboard'] = (True, "Keyboard access available")
-    except ImportError:
-        results['keyboard'] = (False, "keyboard module not installed")
-    except Exception as e:
-        results['keyboard'] = (False, f"Keyboard access error: {e}")
+    if _module_available('keyboard'):
+        keyboard_status = PermissionStatus(True, "Keyboard access available")
+    else:
+        keyboard_status = PermissionStatus(False, "keyboard module not installed")
     
     # Clipboard access check
-    try:
-        import pyperclip
-        # Try to access clipboard
-        pyperclip.paste()
-        results['clipboard'] = (True, "Clipboard access available")
-    except ImportError:
-        results['clipboard'] = (False, "pyperclip module not installed")
-    except Exception as e:
-        results['clipboard'] = (False, f"Clipboard access error: {e}")
+    if _module_available('pyperclip'):
+        clipboard_status = PermissionStatus(True, "Clipboard access available")
+    else:
+        clipboard_status = PermissionStatus(False, "pyperclip module not installed")
     
     # Admin privileges check (optional)
     admin_status = is_admin()
     if admin_status:
-        results['admin'] = (True, "Running with administrator privileges")
+        admin = PermissionStatus(True, "Running with administrator privileges")
     else:
-        results['admin'] = (False, "Not running as administrator (optional)")
+        admin = PermissionStatus(False, "Not running as administrator (optional)")
+    
+    return Permissions(keyboard=keyboard_status, clipboard=clipboard_status, admin=admin)
+
+
+def _module_available(name: str) -> bool:
+    """
+    Check whether a module is installed without importing it
+    
+    Args:
+        name: Top-level module name
+        
+    Returns:
+        bool: True if the module can be found
+    """
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def check_clipboard_runtime() -> PermissionStatus:
+    """
+    Check that the clipboard can actually be read
     
-    return results
+    Imports pyperclip and performs a real paste(), which may touch platform
+    clipboard backends - call only when clipboard access is about to be used.
+    
+    Returns:
+        PermissionStatus: Clipboard read result
+    """
+    try:
+        import pyperclip
+        pyperclip.paste()
+        return PermissionStatus(True, "Clipboard access available")
+    except ImportError:
+        return PermissionStatus(False, "pyperclip module not installed")
+    except Exception as e:
+        return PermissionStatus(False, f"Clipboard access error: {e}")
 
 
-def get_permission_summary() -> str:
+def get_permission_summary(checks: Optional[Permissions] = None) -> str:
     """
     Get a formatted summary of all permission checks
     
+    Args:
+        checks: Results from check_permissions() (checked now if None)
+    
     Returns:
         str: Multi-line string with permission status
     """
-    checks = check_permissions()
+    if checks is None:
+        checks = check_permissions()
     lines = ["Permission Status:"]
     lines.append("-" * 50)
     
@@ -178,20 +263,24 @@ def requires_admin() -> bool:
     return False
 
 
-def can_run() -> Tuple[bool, str]:
+def can_run(checks: Optional[Permissions] = None) -> Tuple[bool, str]:
     """
     Check if application can run with current permissions
     
+    Args:
+        checks: Results from check_permissions() (checked now if None)
+    
     Returns:
         tuple: (can_run: bool, reason: str)
     """
-    checks = check_permissions()
+    if checks is None:
+        checks = check_permissions()
     
     # Required permissions
     required = ['keyboard', 'clipboard']
     
     for perm in required:
-        if not checks.get(perm, (False, ""))[0]:
+        if not getattr(checks, perm).granted:
             return (False, f"Missing required permission: {perm}")
     
     return (True, "All required permissions available")
@@ -200,29 +289,22 @@ def can_run() -> Tuple[bool, str]:
 # Platform detection helpers
 def is_windows():
     """Check if running on Windows"""
-    return sys.platform == 'win32'
+    return _IS_WINDOWS
 
 
 def is_macos():
     """Check if running on macOS"""
-    return sys.platform == 'darwin'
+    return _IS_MACOS
 
 
 def is_linux():
     """Check if running on Linux"""
-    return sys.platform.startswith('linux')
+    return _IS_LINUX
 
 
 def get_platform_name():
     """Get human-readable platform name"""
-    if is_windows():
-        return "Windows"
-    elif is_macos():
-        return "macOS"
-    elif is_linux():
-        return "Linux"
-    else:
-        return sys.platform
+    return _PLATFORM_NAME
 
 
 # Module information
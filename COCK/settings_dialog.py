@@ -253,6 +253,16 @@ if PYQT5_AVAILABLE:
                     "It may not work as expected or could interfere with system functions."
                 )
         
+        def set_hotkey(self, hotkey):
+            """
+            Show a configured hotkey (e.g. when the dialog is refreshed)
+            
+            Args:
+                hotkey: Hotkey string
+            """
+            self.hotkey = hotkey
+            self.label.setText(hotkey or "Not set")
+        
         def clear_hotkey(self):
             """Clear the hotkey"""
             self.hotkey = ''
@@ -300,6 +310,86 @@ if PYQT5_AVAILABLE:
             
             self.init_ui()
         
+        def refresh(self, config: dict, filter_stats: dict = None):
+            """
+            Reload all widgets from config so a hidden dialog can be reused
+            
+            Args:
+                config: Current configuration dictionary
+                filter_stats: Statistics from filter loader (optional)
+            """
+            self.config = config.copy()  # Work with a copy
+            self.filter_stats = filter_stats or {}
+            self.filter_file_changed = False
+            self.original_filter_file = config.get('filter_file', '')
+            
+            optimization = self.config.get('optimization', {})
+            ui = self.config.get('ui', {})
+            notifications = self.config.get('notifications', {})
+            
+            # General tab
+            self.filter_path_label.setText(self.config.get('filter_file', 'Not selected'))
+            self._update_filter_stats_label()
+            self.mode_combo.setCurrentText(self.config.get('detection_mode', 'manual'))
+            self.hotkey_recorder.set_hotkey(self.config.get('hotkey', 'F12'))
+            self.force_hotkey_recorder.set_hotkey(self.config.get('force_optimize_hotkey', 'Ctrl+F12'))
+            self.toggle_hotkey_recorder.set_hotkey(self.config.get('toggle_hotkeys_hotkey', 'Ctrl+Shift+H'))
+            self.byte_limit_spin.setValue(self.config.get('byte_limit', 92))
+            self.char_limit_spin.setValue(self.config.get('character_limit', 80))
+            self.check_updates_cb.setChecked(self.config.get('updates', {}).get('check_enabled', True))
+            
+            # Optimization tab
+            self.leet_enabled.setChecked(optimization.get('leet_speak', True))
+            self.unicode_enabled.setChecked(optimization.get('fancy_unicode', True))
+            self.shorthand_enabled.setChecked(optimization.get('shorthand', True))
+            self.link_protection.setChecked(optimization.get('link_protection', True))
+            self.special_char_enabled.setChecked(optimization.get('special_char_interspacing', False))
+            self.special_char_input.setText(self.config.get('special_char_interspacing', {}).get('character', '❤'))
+            index = self.fancy_style_combo.findData(optimization.get('fancy_text_style', 'squared'))
+            if index >= 0:
+                self.fancy_style_combo.setCurrentIndex(index)
+            self.sliding_window_spin.setValue(self.config.get('max_sliding_window', 3))
+            
+            # Filter / whitelist tabs (re-read from disk, discarding unsaved edits)
+            self.filter_search.blockSignals(True)
+            self.filter_search.clear()
+            self.filter_search.blockSignals(False)
+            self.filter_list.clear()
+            self.load_filter_entries()
+            
+            self.whitelist_search.blockSignals(True)
+            self.whitelist_search.clear()
+            self.whitelist_search.blockSignals(False)
+            self.whitelist_list.clear()
+            self.load_whitelist_entries()
+            
+            # UI tab
+            self.theme_combo.setCurrentText(ui.get('theme', 'dark'))
+            self.notif_sound_check.setChecked(ui.get('notification_sound', True))
+            self.prompt_sound_check.setChecked(ui.get('prompt_sound', True))
+            self.notif_position_combo.setCurrentText(ui.get('notification_position', 'bottom-right'))
+            self.notif_offset_x_spin.setValue(ui.get('notification_offset_x', 20))
+            self.notif_offset_y_spin.setValue(ui.get('notification_offset_y', 20))
+            self.prompt_position_combo.setCurrentText(ui.get('prompt_position', 'center'))
+            self.prompt_offset_x_spin.setValue(ui.get('prompt_offset_x', 0))
+            self.prompt_offset_y_spin.setValue(ui.get('prompt_offset_y', 0))
+            self.notif_scale_slider.setValue(int(ui.get('notification_scale', 1.0) * 100))
+            self.prompt_scale_slider.setValue(int(ui.get('prompt_scale', 1.0) * 100))
+            self.settings_scale_slider.setValue(int(ui.get('settings_scale', 1.0) * 100))
+            self.notif_enabled.setChecked(notifications.get('enabled', True))
+            self.notif_show_clean.setChecked(notifications.get('show_clean_messages', True))
+            self.notif_show_optimized.setChecked(notifications.get('show_optimized_messages', True))
+            self.popup_duration_spin.setValue(notifications.get('duration_ms', 2000))
+        
+        def _update_filter_stats_label(self):
+            """Show filter loader statistics (hidden when there are none)"""
+            if self.filter_stats:
+                self.filter_stats_label.setText(
+                    f"Loaded entries: {self.filter_stats.get('final_count', 0)}\n"
+                    f"Load time: {self.filter_stats.get('load_time_ms', 0):.0f}ms"
+                )
+            self.filter_stats_label.setVisible(bool(self.filter_stats))
+        
         def init_ui(self):
             """Initialize the user interface"""
             # Get scaling factor
@@ -313,12 +403,6 @@ if PYQT5_AVAILABLE:
             self.setWindowTitle("Compliant Online Chat Kit - Settings")
             self.setMinimumWidth(int(600 * scale))
             self.setMinimumHeight(int(500 * scale))
-
-            # Set window icon for taskbar
-            icon_path = path_manager.get_resource_file('icons/icon.ico')
-            if os.path.exists(icon_path):
-                from PyQt5.QtGui import QIcon
-                self.setWindowIcon(QIcon(icon_path))
             
             # Apply font scaling to entire dialog
             if scale != 1.0:
@@ -392,10 +476,8 @@ if PYQT5_AVAILABLE:
             
             # App icon
             icon_label = QLabel()
-            icon_path = path_manager.get_resource_file('icons/icon.ico')
-            if os.path.exists(icon_path):
-                from PyQt5.QtGui import QIcon
-                icon = QIcon(icon_path)
+            icon = QApplication.windowIcon()  # Set once by the app (see main.py _app_icon)
+            if not icon.isNull():
                 pixmap = icon.pixmap(24, 24)  # Extract 24×24 from ICO
                 icon_label.setPixmap(pixmap)
             
@@ -489,12 +571,9 @@ if PYQT5_AVAILABLE:
             filter_layout.addWidget(browse_btn)
             
             # Stats display
-            if self.filter_stats:
-                stats_text = QLabel(
-                    f"Loaded entries: {self.filter_stats.get('final_count', 0)}\n"
-                    f"Load time: {self.filter_stats.get('load_time_ms', 0):.0f}ms"
-                )
-                filter_layout.addWidget(stats_text)
+            self.filter_stats_label = QLabel()
+            self._update_filter_stats_label()
+            filter_layout.addWidget(self.filter_stats_label)
             
             filter_group.setLayout(filter_layout)
             layout.addWidget(filter_group)
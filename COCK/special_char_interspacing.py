@@ -18,6 +18,29 @@ Example (force mode):
     "test message" → "t❤e❤s❤t❤ ❤m❤e❤s❤s❤a❤g❤e"
 """
 
+import re
+from functools import lru_cache
+from typing import Optional
+import fast_detector
+
+
+# Characters the sliding-window detector keeps when stripping a window
+_ALNUM_RE = re.compile(r'[A-Za-z0-9]')
+
+
+@lru_cache(maxsize=32)
+def _interspaceable_words(words: tuple) -> tuple:
+    """
+    Drop words too short to interspace and sort the rest longest first
+    
+    Args:
+        words: Flagged words (callers usually repeat the same list)
+        
+    Returns:
+        tuple: Words with 2+ chars, longest first
+    """
+    return tuple(sorted((w for w in words if len(w) >= 2), key=len, reverse=True))
+
 
 class SpecialCharInterspacing:
     """
@@ -31,14 +54,16 @@ class SpecialCharInterspacing:
     
     DEFAULT_CHAR = '❤'  # Heart symbol (U+2764, 3 bytes)
     
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, debug: bool = False):
         """
         Initialize special character interspacing
         
         Args:
             config: Configuration dictionary with 'special_char_interspacing' section
+            debug: Print interspacing trace lines (see _log)
         """
         self.config = config
+        self.debug = debug
         interspacing_config = config.get('special_char_interspacing', {})
         
         # Get user's custom character or use default
@@ -48,6 +73,53 @@ class SpecialCharInterspacing:
         if not self.char or len(self.char) != 1:
             print(f"[INTERSPACING] Warning: Invalid character '{self.char}', using default ❤")
             self.char = self.DEFAULT_CHAR
+        self._char_bytes = len(self.char.encode('utf-8'))  # Kept in sync by set_char/reset_to_default
+        
+        # Compiled case-insensitive patterns, keyed by word (see _word_pattern)
+        self._pat_cache = {}
+        self._pat_cache_boundary = {}
+    
+    def _log(self, message: str, *args):
+        """
+        Print an interspacing trace line in debug mode
+        
+        Nothing is formatted unless debug is on; extra args are %-formatted into message.
+        """
+        if not self.debug:
+            return
+        print(message % args if args else message)
+    
+    def _word_pattern(self, word: str):
+        """
+        Get the cached case-insensitive pattern matching word anywhere
+        
+        Args:
+            word: Word to match
+            
+        Returns:
+            re.Pattern: Compiled pattern
+        """
+        pattern = self._pat_cache.get(word)
+        if pattern is None:
+            pattern = re.compile(re.escape(word), re.IGNORECASE)
+            self._pat_cache[word] = pattern
+        return pattern
+    
+    def _boundary_pattern(self, word: str):
+        """
+        Get the cached case-insensitive pattern matching word as a whole word
+        
+        Args:
+            word: Word to match
+            
+        Returns:
+            re.Pattern: Compiled pattern
+        """
+        pattern = self._pat_cache_boundary.get(word)
+        if pattern is None:
+            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+            self._pat_cache_boundary[word] = pattern
+        return pattern
     
     def apply_to_word(self, word: str) -> str:
         """
@@ -93,42 +165,55 @@ class SpecialCharInterspacing:
             
             text="test 420", flagged=["420"]
             → "test 4❤20"
+            
+            text="FUCK", flagged=["fuck"]
+            → "F❤UCK" (matched text keeps its case)
+            
+            Overlapping words are all interspaced, longest first:
+            
+            >>> s = SpecialCharInterspacing({})
+            >>> s.apply_to_text("fuck", ["fuck", "uck"])
+            'f❤u❤ck'
+            >>> s.apply_to_text("abc", ["abc", "bc", "c"])
+            'a❤b❤c'
+            >>> s.apply_to_text("FUCK", ["fuck"])
+            'F❤UCK'
+            >>> s.apply_to_text("fucker fucker", ["fucker", "fuck"])
+            'f❤ucker f❤ucker'
         """
         if not flagged_words:
-            print(f"[INTERSPACING] No flagged words provided")
+            self._log("[INTERSPACING] No flagged words provided")
             return text
         
-        result = text
-        
-        # Process each flagged word
         # Sort by length (longest first) to avoid partial replacements
-        sorted_words = sorted(flagged_words, key=len, reverse=True)
+        sorted_words = _interspaceable_words(tuple(flagged_words))
         
-        print(f"[INTERSPACING] Processing {len(sorted_words)} flagged words with char '{self.char}'")
+        self._log("[INTERSPACING] Processing %d flagged words with char '%s'", len(sorted_words), self.char)
         
+        if not sorted_words:
+            return text
+        
+        # Cheap substring precheck before the regex searches (clean text is the common case).
+        # Only for ASCII text, where lower() agrees with the regex's case-insensitive matching.
+        if text.isascii():
+            text_lower = text.lower()
+            if not any(w.lower() in text_lower for w in sorted_words):
+                self._log("[INTERSPACING] No flagged words found in text")
+                return text
+        
+        # One occurrence per word, longest first, on the already-modified text:
+        # a shorter word can still hit an overlapping or later occurrence of a longer one
+        result = text
         for word in sorted_words:
-            if len(word) < 2:
-                print(f"[INTERSPACING] Skipping '{word}' (too short)")
+            match = self._word_pattern(word).search(result)
+            if not match:
+                self._log("[INTERSPACING] WARNING: '%s' not found in text!", word)
+                self._log("[INTERSPACING] Text: %.50s...", result)
                 continue
             
-            # Create interspaced version
-            interspaced = self.apply_to_word(word)
-            
-            print(f"[INTERSPACING] Looking for '{word}' to replace with '{interspaced}'")
-            
-            # Replace in text (case-insensitive)
-            import re
-            pattern = re.compile(re.escape(word), re.IGNORECASE)
-            
-            # Check if pattern found
-            matches = pattern.findall(result)
-            if matches:
-                print(f"[INTERSPACING] Found {len(matches)} occurrence(s) of '{word}'")
-                result = pattern.sub(interspaced, result, count=1)
-                print(f"[INTERSPACING] Replaced '{word}' with '{interspaced}'")
-            else:
-                print(f"[INTERSPACING] WARNING: '{word}' not found in text!")
-                print(f"[INTERSPACING] Text: {result[:50]}...")
+            # Interspace the matched text itself so the user's casing is kept
+            result = result[:match.start()] + self.apply_to_word(match.group(0)) + result[match.end():]
+            self._log("[INTERSPACING] Replaced '%s' at position %d", match.group(0), match.start())
         
         return result
     
@@ -151,105 +236,131 @@ class SpecialCharInterspacing:
             Result: "Du❤ring" (insert after position 1)
         """
         if not detection_results:
-            print(f"[INTERSPACING] No detection results provided")
+            self._log("[INTERSPACING] No detection results provided")
             return text
         
-        # Sort detection results by position (process from end to start to avoid offset issues)
+        # Collect insertion positions first, then apply them all in one pass at the end
         # For embedding results, we need to insert at the position of the filtered word
-        insertions = []  # List of (position, char) tuples
+        insertions = []  # Text positions to insert self.char at
         
         for result in detection_results:
-            # Get the full word and filtered word
-            filtered_word = result.filtered_word.lower()
+            handler = self._POSITION_HANDLERS.get(result.detection_type)
+            if handler is None:
+                continue
+            insert_pos = handler(self, text, result, result.filtered_word.lower())
+            if insert_pos is not None:
+                insertions.append(insert_pos)
+        
+        if not insertions:
+            return text
+        
+        # Split the text at each insertion point and join once with the char
+        # (a repeated position yields an empty piece, i.e. two chars there)
+        text_len = len(text)
+        positions = sorted(pos for pos in insertions if 0 <= pos <= text_len)
+        for pos in positions:
+            self._log("[INTERSPACING] Inserting '%s' at position %d", self.char, pos)
+        
+        bounds = [0] + positions + [text_len]
+        return self.char.join([text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)])
+    
+    def _position_embedding(self, text: str, result, filtered_word: str) -> Optional[int]:
+        """
+        Find the insert position for an EMBEDDING detection
+        
+        Args:
+            text: Original text
+            result: DetectionResult (uses full_word)
+            filtered_word: Lowercased filtered word
             
-            if result.detection_type.name == 'EMBEDDING' and result.full_word:
-                # Embedding: filtered word is within a larger word
-                full_word = result.full_word
-                
-                # Find the full word in the text (case-insensitive)
-                import re
-                pattern = re.compile(re.escape(full_word), re.IGNORECASE)
-                matches = list(pattern.finditer(text))
-                
-                if matches:
-                    match = matches[0]  # Use first match
-                    word_start = match.start()
-                    
-                    # Find where the filtered word appears in the full word
-                    full_word_lower = full_word.lower()
-                    filtered_pos_in_word = full_word_lower.find(filtered_word)
-                    
-                    if filtered_pos_in_word >= 0:
-                        # Calculate absolute position in text where we need to insert
-                        # Insert after the first character of the filtered word
-                        insert_pos = word_start + filtered_pos_in_word + 1
-                        
-                        insertions.append((insert_pos, self.char))
-                        print(f"[INTERSPACING] Embedding: '{filtered_word}' in '{full_word}' at word pos {filtered_pos_in_word}")
-                        print(f"[INTERSPACING]   Inserting '{self.char}' at text position {insert_pos}")
-                else:
-                    print(f"[INTERSPACING] WARNING: Full word '{full_word}' not found in text")
+        Returns:
+            int: Text position after the filtered word's first char, or None
+        """
+        # Embedding: filtered word is within a larger word
+        full_word = result.full_word
+        if not full_word:
+            return None
+        
+        # Find the full word in the text (case-insensitive)
+        match = self._word_pattern(full_word).search(text)  # Use first match
+        if not match:
+            self._log("[INTERSPACING] WARNING: Full word '%s' not found in text", full_word)
+            return None
+        
+        # Find where the filtered word appears in the full word
+        filtered_pos_in_word = full_word.lower().find(filtered_word)
+        if filtered_pos_in_word < 0:
+            return None
+        
+        # Insert after the first character of the filtered word
+        insert_pos = match.start() + filtered_pos_in_word + 1
+        self._log("[INTERSPACING] Embedding: '%s' in '%s' at word pos %d", filtered_word, full_word, filtered_pos_in_word)
+        self._log("[INTERSPACING]   Inserting '%s' at text position %d", self.char, insert_pos)
+        return insert_pos
+    
+    def _position_standalone(self, text: str, result, filtered_word: str) -> Optional[int]:
+        """
+        Find the insert position for a STANDALONE detection
+        
+        Args:
+            text: Original text
+            result: DetectionResult
+            filtered_word: Lowercased filtered word
             
-            elif result.detection_type.name == 'STANDALONE':
-                # Standalone word: use the standard approach
-                # Find the word and insert after first character
-                import re
-                pattern = re.compile(r'\b' + re.escape(filtered_word) + r'\b', re.IGNORECASE)
-                matches = list(pattern.finditer(text))
-                
-                if matches:
-                    match = matches[0]
-                    insert_pos = match.start() + 1  # After first character
-                    insertions.append((insert_pos, self.char))
-                    print(f"[INTERSPACING] Standalone: '{filtered_word}' at position {insert_pos}")
-                else:
-                    print(f"[INTERSPACING] WARNING: Standalone word '{filtered_word}' not found")
+        Returns:
+            int: Text position after the word's first char, or None
+        """
+        match = self._boundary_pattern(filtered_word).search(text)
+        if not match:
+            self._log("[INTERSPACING] WARNING: Standalone word '%s' not found", filtered_word)
+            return None
+        
+        insert_pos = match.start() + 1  # After first character
+        self._log("[INTERSPACING] Standalone: '%s' at position %d", filtered_word, insert_pos)
+        return insert_pos
+    
+    def _position_window(self, text: str, result, filtered_word: str) -> Optional[int]:
+        """
+        Find the insert position for a STRIPPED_WINDOW (sliding window) detection
+        
+        Args:
+            text: Original text
+            result: DetectionResult (uses window_range)
+            filtered_word: Lowercased filtered word
             
-            elif result.detection_type.name == 'STRIPPED_WINDOW' and result.window_range:
-                # Sliding window: find where filtered word appears in the window
-                start, end = result.window_range
-                filtered_word = result.filtered_word.lower()
-                
-                # Extract the window text
-                window_text = text[start:end]
-                
-                # Strip it like the detector does (remove non-alphanumeric)
-                import re as re_module
-                stripped_window = re_module.sub(r'[^a-zA-Z0-9]', '', window_text).lower()
-                
-                # Find where filtered word appears in stripped window
-                filtered_pos_in_stripped = stripped_window.find(filtered_word)
-                
-                if filtered_pos_in_stripped >= 0:
-                    # Map back to original text position
-                    # Count alphanumeric characters in window until we reach filtered_pos
-                    char_count = 0
-                    for i, char in enumerate(window_text):
-                        if char.isalnum():
-                            if char_count == filtered_pos_in_stripped:
-                                # Found it - insert after this character
-                                insert_pos = start + i + 1
-                                insertions.append((insert_pos, self.char))
-                                print(f"[INTERSPACING] Sliding window: '{filtered_word}' starts at position {insert_pos}")
-                                break
-                            char_count += 1
-                else:
-                    # Fallback: insert at window start
-                    insert_pos = start + 1
-                    insertions.append((insert_pos, self.char))
-                    print(f"[INTERSPACING] Sliding window (fallback): inserting at position {insert_pos}")
-        
-        # Sort insertions by position (descending) to avoid offset issues
-        insertions.sort(key=lambda x: x[0], reverse=True)
-        
-        # Apply insertions from end to start
-        result_text = text
-        for pos, char in insertions:
-            if 0 <= pos <= len(result_text):
-                result_text = result_text[:pos] + char + result_text[pos:]
-                print(f"[INTERSPACING] Inserted '{char}' at position {pos}")
-        
-        return result_text
+        Returns:
+            int: Text position after the word's first char (window start + 1
+                 if it can't be located), or None without a window range
+        """
+        if not result.window_range:
+            return None
+        start, end = result.window_range
+        window_text = text[start:end]
+        
+        # Strip it like the detector does (remove non-alphanumeric),
+        # remembering each kept char's index in the window
+        alnum_indices = [m.start() for m in _ALNUM_RE.finditer(window_text)]
+        stripped_window = ''.join([window_text[i] for i in alnum_indices]).lower()
+        
+        # Find where filtered word appears in stripped window
+        filtered_pos_in_stripped = stripped_window.find(filtered_word)
+        
+        if filtered_pos_in_stripped >= 0:
+            # Map back to original text position - insert after its first character
+            insert_pos = start + alnum_indices[filtered_pos_in_stripped] + 1
+            self._log("[INTERSPACING] Sliding window: '%s' starts at position %d", filtered_word, insert_pos)
+        else:
+            # Fallback: insert at window start
+            insert_pos = start + 1
+            self._log("[INTERSPACING] Sliding window (fallback): inserting at position %d", insert_pos)
+        return insert_pos
+    
+    # DetectionType -> insert position finder (other types are skipped)
+    _POSITION_HANDLERS = {
+        fast_detector.DetectionType.EMBEDDING: _position_embedding,
+        fast_detector.DetectionType.STANDALONE: _position_standalone,
+        fast_detector.DetectionType.STRIPPED_WINDOW: _position_window,
+    }
     
     def apply_force_mode(self, text: str) -> str:
         """
@@ -272,13 +383,7 @@ class SpecialCharInterspacing:
             return text
         
         # Insert special char between every character
-        result = []
-        for i, char in enumerate(text):
-            result.append(char)
-            if i < len(text) - 1:  # Don't add after last char
-                result.append(self.char)
-        
-        return ''.join(result)
+        return self.char.join(text)
     
     def get_char(self) -> str:
         """Get current special character"""
@@ -298,11 +403,13 @@ class SpecialCharInterspacing:
             return False
         
         self.char = char
+        self._char_bytes = len(char.encode('utf-8'))
         return True
     
     def reset_to_default(self):
         """Reset to default character (❤)"""
         self.char = self.DEFAULT_CHAR
+        self._char_bytes = len(self.DEFAULT_CHAR.encode('utf-8'))
     
     def get_overhead_info(self) -> dict:
         """
@@ -316,7 +423,7 @@ class SpecialCharInterspacing:
                 'per_char': overhead per char (force mode)
             }
         """
-        char_bytes = len(self.char.encode('utf-8'))
+        char_bytes = self._char_bytes
         
         return {
             'char': self.char,
@@ -10,7 +10,7 @@ import random
 import os
 from PyQt5.QtWidgets import QSplashScreen
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt5.QtWidgets import QGraphicsOpacityEffect
 import path_manager
 
@@ -19,8 +19,12 @@ class AnimatedSplashScreen(QSplashScreen):
     """
     Custom splash screen with fade in/out animations
     Randomly selects from multiple splash designs
+    
+    Emits finished once the fade out completes and the splash is closed.
     """
     
+    finished = pyqtSignal()
+    
     def __init__(self, splash_duration=3000):
         """
         Initialize animated splash screen
@@ -58,6 +62,7 @@ class AnimatedSplashScreen(QSplashScreen):
         
         self.splash_duration = splash_duration
         self.fade_duration = 500  # 500ms for fade in/out
+        self.is_finished = False  # Set when the fade out completes
         
         # Set up opacity effect for fading
         self.opacity_effect = QGraphicsOpacityEffect(self)
@@ -105,8 +110,14 @@ class AnimatedSplashScreen(QSplashScreen):
         self.fade_out_anim.setStartValue(1.0)
         self.fade_out_anim.setEndValue(0.0)
         self.fade_out_anim.setEasingCurve(QEasingCurve.InOutQuad)
-        self.fade_out_anim.finished.connect(self.close)
+        self.fade_out_anim.finished.connect(self._on_fade_out_finished)
         self.fade_out_anim.start()
+    
+    def _on_fade_out_finished(self):
+        """Close the splash and notify listeners"""
+        self.close()
+        self.is_finished = True
+        self.finished.emit()
 
 
 def show_splash(app, duration=3000):
@@ -12,6 +12,7 @@ Features:
 """
 
 import os
+import sys
 from typing import Set, Optional
 import threading
 
@@ -23,6 +24,10 @@ class WhitelistManager:
     Whitelist: Words that are safe when embedded (e.g., "ass" in "assassin")
     These words are NOT flagged for optimization when found embedded in larger words.
     Standalone instances are still flagged.
+    
+    Entries are interned with sys.intern() so membership tests against
+    interned candidate tokens short-circuit on identity. Callers doing
+    repeated lookups (e.g. the detector) should intern their tokens too.
     """
     
     def __init__(self, whitelist_path: str):
@@ -35,6 +40,9 @@ class WhitelistManager:
         self.whitelist_path = whitelist_path
         self.whitelist: Set[str] = set()
         
+        # File modification time at last load (see reload_if_changed)
+        self._last_mtime: Optional[int] = None
+        
         # Thread lock for safe concurrent access
         self._lock = threading.Lock()
         
@@ -43,8 +51,35 @@ class WhitelistManager:
     
     def _load_whitelist(self) -> None:
         """Load whitelist from file"""
+        # Stat before reading so a write racing the read triggers another reload
+        self._last_mtime = self._get_mtime()
         self.whitelist = self._load_word_file(self.whitelist_path)
     
+    def _get_mtime(self) -> Optional[int]:
+        """
+        Get whitelist file modification time
+        
+        Returns:
+            int: st_mtime_ns, or None if the file doesn't exist
+        """
+        try:
+            return os.stat(self.whitelist_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload whitelist if the file changed on disk since the last load
+        
+        Returns:
+            bool: True if the whitelist was reloaded
+        """
+        if self._get_mtime() == self._last_mtime:
+            return False
+        
+        self._load_whitelist()
+        return True
+    
     def _load_word_file(self, filepath: str) -> Set[str]:
         """
         Load words from file
@@ -68,7 +103,7 @@ class WhitelistManager:
                     
                     # Skip empty lines and comments
                     if word and not word.startswith('#'):
-                        words.add(word)
+                        words.add(sys.intern(word))
         except Exception as e:
             print(f"WARNING: Failed to load {filepath}: {e}")
         
@@ -104,7 +139,7 @@ class WhitelistManager:
         
         with self._lock:
             # Add to whitelist
-            self.whitelist.add(word_lower)
+            self.whitelist.add(sys.intern(word_lower))
             
             # Save to file
             return self._save_whitelist()
@@ -22,8 +22,24 @@ import sys
 import os
 import argparse
 import traceback
+import types
+import functools
+import mmap
+import codecs
+import collections
+import itertools
+import time
+import copy
+import threading
+import signal
+from datetime import datetime
 from typing import Optional
 
+try:
+    import winsound
+except ImportError:
+    winsound = None  # Windows only
+
 # Fix Windows console encoding for Unicode characters (heart emoji, fancy text, etc.)
 if sys.platform == 'win32':
     import io
@@ -36,58 +52,251 @@ if sys.platform == 'win32':
 # Add COCK directory to path (all modules are in COCK folder)
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'COCK'))
 
-# Import Phase 1 modules
+# Core modules needed before the app initializes
 import constants
 import path_manager
-import permission_manager
 import config_loader
-import filter_loader
-import clipboard_manager
-import hotkey_handler
-
-# Import Phase 2 modules
-import fast_detector
-import whitelist_manager
 
-# Import Phase 3 modules
-import leet_speak
-import fancy_text
-import shorthand_handler
-import message_optimizer
-import mode_router
+# Phase modules (and the _MODE_MANUAL/_MODE_AUTO DetectionMode members) are
+# imported lazily by _import_core_modules/_import_ui_modules, so --help and a
+# rejected second instance don't load them. PyQt5 itself is still imported below.
 
-# Import Phase 4 modules (with graceful fallback)
-import overlay_manual  # Renamed from overlay_strict
-# overlay_permissive removed - no longer used (replaced with auto mode)
-import settings_dialog
-
-# Import Phase 5 modules (update and help systems)
-import update_checker
-import help_manager
+def _import_core_modules():
+    """Import detection/optimization modules (called from COCK.initialize)"""
+    global permission_manager, filter_loader, clipboard_manager, hotkey_handler
+    global fast_detector, whitelist_manager
+    global leet_speak, fancy_text, shorthand_handler, message_optimizer, mode_router
+    global update_checker, help_manager
+    global _MODE_MANUAL, _MODE_AUTO
+    
+    # Import Phase 1 modules
+    import permission_manager
+    import filter_loader
+    import clipboard_manager
+    import hotkey_handler
+    
+    # Import Phase 2 modules
+    import fast_detector
+    import whitelist_manager
+    
+    # Import Phase 3 modules
+    import leet_speak
+    import fancy_text
+    import shorthand_handler
+    import message_optimizer
+    import mode_router
+    _MODE_MANUAL = mode_router.DetectionMode.MANUAL
+    _MODE_AUTO = mode_router.DetectionMode.AUTO
+    
+    # Import Phase 5 modules (update and help systems)
+    import update_checker
+    import help_manager
 
-# For console window control on Windows
-if sys.platform == 'win32':
-    import ctypes
-    from ctypes import wintypes
+def _import_ui_modules():
+    """Import Qt UI modules (called from COCK.init_ui)"""
+    global overlay_manual, settings_dialog
+    
+    # Import Phase 4 modules
+    import overlay_manual  # Renamed from overlay_strict
+    # overlay_permissive removed - no longer used (replaced with auto mode)
+    import settings_dialog
 
 # Check PyQt5 availability
 try:
     from PyQt5.QtWidgets import (
         QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox, 
-        QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit
+        QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit,
+        QWidget, QLabel, QActionGroup, QFileDialog
     )
     from PyQt5.QtGui import QIcon, QFont
-    from PyQt5.QtCore import QObject, pyqtSignal, QTimer, Qt
+    from PyQt5.QtCore import QObject, pyqtSignal, QTimer, Qt, QRunnable, QThreadPool, QSignalBlocker
     PYQT5_AVAILABLE = True
 except ImportError:
     print("WARNING: PyQt5 not installed. Install with: pip install PyQt5")
     print("Running in console mode without GUI...")
     PYQT5_AVAILABLE = False
 
+def _sanitize_restart_args(argv):
+    """
+    Filter command-line arguments for re-exec on restart
+    
+    Only script paths, --debug/--config and --config=<existing .json> are kept,
+    to prevent command injection through restarted arguments.
+    
+    Args:
+        argv: Original argument list (sys.argv)
+    
+    Returns:
+        list: Arguments safe to pass to os.execv
+    """
+    safe_args = []
+    for arg in argv:
+        if arg.endswith('.py') or arg in ('--debug', '--config'):
+            safe_args.append(arg)
+        elif arg.startswith('--config='):
+            config_path = arg.split('=', 1)[1]
+            if config_path.endswith('.json') and os.path.exists(config_path):
+                safe_args.append(arg)
+    return safe_args
+
+# Tray menu Fancy Text Style entries (style key -> label, in menu order)
+TRAY_STYLE_NAMES = {
+    'squared': 'Squared (🄵🅄🄲🄺)',
+    'bold': 'Bold (𝐟𝐮𝐜𝐤)',
+    'italic': 'Italic (𝑓𝑢𝑐𝑘)',
+    'bold_italic': 'Bold Italic (𝒇𝒖𝒄𝒌)',
+    'sans_serif': 'Sans-Serif (𝖿𝗎𝖼𝗄)',
+    'circled': 'Circled (ⓕⓤⓒⓚ)',
+    'negative_squared': 'Negative Squared (🅵🆄🅲🅺)',
+    'negative_circled': 'Negative Circled (🅕🅤🅒🅚)'
+}
+
+# Tray menu Max Sliding Window entries (size, label)
+TRAY_WINDOW_SIZES = [
+    (2, "2-word (Fast)"),
+    (3, "3-word (Default)"),
+    (4, "4-word"),
+    (5, "5-word (Comprehensive)")
+]
+
+# Notification stylesheets by theme (anything other than 'dark' uses light)
+NOTIFICATION_STYLESHEETS = {
+    'dark': """
+        QWidget {
+            background-color: #2b2b2b;
+            color: white;
+            border: 2px solid #555;
+            border-radius: 8px;
+            padding: 10px;
+        }
+    """,
+    'light': """
+        QWidget {
+            background-color: #f0f0f0;
+            color: black;
+            border: 2px solid #ccc;
+            border-radius: 8px;
+            padding: 10px;
+        }
+    """
+}
+
+# Notification position presets: (screen_rect, width, height, offset_x, offset_y) -> (x, y)
+POSITION_FUNCS = {
+    'top-left': lambda sr, w, h, ox, oy: (ox, oy),
+    'top-center': lambda sr, w, h, ox, oy: ((sr.width() - w) // 2 + ox, oy),
+    'top-right': lambda sr, w, h, ox, oy: (sr.width() - w - ox, oy),
+    'center-left': lambda sr, w, h, ox, oy: (ox, (sr.height() - h) // 2 + oy),
+    'center': lambda sr, w, h, ox, oy: ((sr.width() - w) // 2 + ox, (sr.height() - h) // 2 + oy),
+    'center-right': lambda sr, w, h, ox, oy: (sr.width() - w - ox, (sr.height() - h) // 2 + oy),
+    'bottom-left': lambda sr, w, h, ox, oy: (ox, sr.height() - h - oy),
+    'bottom-center': lambda sr, w, h, ox, oy: ((sr.width() - w) // 2 + ox, sr.height() - h - oy),
+    'bottom-right': lambda sr, w, h, ox, oy: (sr.width() - w - ox, sr.height() - h - oy),
+}
+
+def _get_notification_assets(theme: str, scale: float):
+    """
+    Build notification fonts and stylesheet for a (theme, scale)
+    
+    Returns:
+        tuple: (title_font, message_font, stylesheet)
+    """
+    title_font = QFont()
+    title_font.setBold(True)
+    title_font.setPointSize(int(10 * scale))
+    
+    message_font = QFont()
+    message_font.setPointSize(int(9 * scale))
+    
+    stylesheet = NOTIFICATION_STYLESHEETS['dark' if theme == 'dark' else 'light']
+    return title_font, message_font, stylesheet
+
+# Number of notification popups kept around for reuse
+NOTIFICATION_POOL_SIZE = 4
+
+# Number of rendered notification pixmaps kept (see COCK._render_notification_pixmap)
+NOTIFICATION_PIXMAP_CACHE_SIZE = 32
+
+def _build_notification_widget():
+    """
+    Create an (unstyled) notification content widget
+    
+    Only used off-screen to render notification pixmaps.
+    
+    Returns:
+        QWidget: Widget with title_label and message_label attributes
+    """
+    notification = QWidget()
+    notification.setAttribute(Qt.WA_TranslucentBackground)
+    
+    layout = QVBoxLayout()
+    
+    # Title label
+    notification.title_label = QLabel()
+    layout.addWidget(notification.title_label)
+    
+    # Message label
+    notification.message_label = QLabel()
+    notification.message_label.setWordWrap(True)
+    layout.addWidget(notification.message_label)
+    
+    notification.setLayout(layout)
+    notification.style_key = None
+    return notification
+
+def _style_notification_widget(notification, theme: str, scale: float):
+    """Apply theme/scale styling to a notification widget (no-op if unchanged)"""
+    if notification.style_key == (theme, scale):
+        return
+    
+    title_font, message_font, stylesheet = _get_notification_assets(theme, scale)
+    notification.title_label.setFont(title_font)
+    notification.message_label.setFont(message_font)
+    
+    # Apply padding scale
+    layout = notification.layout()
+    padding = int(12 * scale)
+    layout.setContentsMargins(padding, padding, padding, padding)
+    layout.setSpacing(int(8 * scale))
+    
+    # Style based on theme
+    notification.setStyleSheet(stylesheet)
+    notification.style_key = (theme, scale)
+
+def _build_notification_popup():
+    """
+    Create a frameless popup that displays a rendered notification pixmap
+    
+    Returns:
+        QLabel: Popup label (call setPixmap before showing)
+    """
+    popup = QLabel()
+    popup.setWindowFlags(
+        Qt.WindowStaysOnTopHint | 
+        Qt.FramelessWindowHint | 
+        Qt.Tool
+    )
+    popup.setAttribute(Qt.WA_TranslucentBackground)
+    popup.setAttribute(Qt.WA_ShowWithoutActivating)
+    return popup
+
+@functools.lru_cache(maxsize=1)
+def _app_icon():
+    """
+    Load the application icon once (empty QIcon if missing)
+    
+    Set application-wide in run(); dialogs pick it up from there.
+    """
+    icon_path = path_manager.get_resource_file('icons/icon.ico')
+    return QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
+
+# Single-instance handles (kept referenced so they live as long as the process)
+_INSTANCE_MUTEX = None
+_INSTANCE_LOCK = None
+
 def check_single_instance():
     """Ensure only one instance of the app is running"""
-    import sys
-    import os
+    global _INSTANCE_MUTEX, _INSTANCE_LOCK
     import ctypes
     
     if sys.platform == 'win32':
@@ -108,7 +317,7 @@ def check_single_instance():
             return False
         
         # Keep mutex handle in global to prevent garbage collection
-        globals()['_instance_mutex'] = mutex
+        _INSTANCE_MUTEX = mutex
         return True
     else:
         # Linux/Mac: Use file lock
@@ -119,7 +328,7 @@ def check_single_instance():
             lock_fd = open(lock_file, 'w')
             import fcntl
             fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-            globals()['_instance_lock'] = lock_fd
+            _INSTANCE_LOCK = lock_fd
             return True
         except (IOError, ImportError):
             return False
@@ -134,11 +343,6 @@ if PYQT5_AVAILABLE:
             self.setWindowFlags(Qt.Window)
             self.resize(900, 600)
             
-            # Set window icon
-            icon_path = path_manager.get_resource_file('icons/icon.ico')
-            if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
-            
             layout = QVBoxLayout()
             
             # Text display
@@ -172,6 +376,13 @@ if PYQT5_AVAILABLE:
             layout.addLayout(button_layout)
             self.setLayout(layout)
             
+            # Pending lines, flushed to the text edit in batches (~30 Hz)
+            self._pending = collections.deque()
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(33)
+            self._flush_timer.timeout.connect(self._flush)
+            
             # Add welcome message
             self.append_text("="*80)
             self.append_text("COCK Profanity Processor - Debug Console")
@@ -182,8 +393,19 @@ if PYQT5_AVAILABLE:
             self.append_text("")
         
         def append_text(self, text):
-            """Append text to console"""
-            self.text_edit.append(text)
+            """Queue text for the console (appended on the next flush)"""
+            self._pending.append(text)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+        
+        def _flush(self):
+            """Append all queued lines in one go"""
+            if not self._pending:
+                return
+            
+            lines = '\n'.join(self._pending)
+            self._pending.clear()
+            self.text_edit.append(lines)
             # Auto-scroll to bottom
             scrollbar = self.text_edit.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
@@ -192,6 +414,47 @@ if PYQT5_AVAILABLE:
             """Override close to hide instead of destroy"""
             event.ignore()
             self.hide()
+    
+    class HotkeyWorker(QRunnable):
+        """Runs clipboard capture + detection for one hotkey press off the GUI thread"""
+        
+        def __init__(self, app, force_mode):
+            super().__init__()
+            self.app = app
+            self.force_mode = force_mode
+        
+        def run(self):
+            """Capture and process, then hand the result back to the main thread"""
+            self.app.hotkey_processed.emit(self.app._capture_and_process(self.force_mode))
+    
+    class ConfigSaveWorker(QRunnable):
+        """Writes a debounced config snapshot off the GUI thread"""
+        
+        def __init__(self, app, snapshot, seq):
+            super().__init__()
+            self.app = app
+            self.snapshot = snapshot
+            self.seq = seq
+        
+        def run(self):
+            """Write the snapshot unless a newer save superseded it"""
+            self.app._write_config_snapshot(self.snapshot, self.seq)
+    
+    class ExportWorker(QRunnable):
+        """Sorts and writes an exported filter list off the GUI thread"""
+        
+        def __init__(self, app, filename, words, source_path):
+            super().__init__()
+            self.app = app
+            self.filename = filename
+            self.words = words
+            self.source_path = source_path
+        
+        def run(self):
+            """Write the export, then hand the outcome back to the main thread"""
+            self.app.export_finished.emit(
+                self.app._write_filter_export(self.filename, self.words, self.source_path)
+            )
 
 class COCK(QObject if PYQT5_AVAILABLE else object):
     """
@@ -211,8 +474,10 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         hotkey_pressed = pyqtSignal()
         force_hotkey_pressed = pyqtSignal()
         toggle_hotkey_pressed = pyqtSignal()
+        hotkey_processed = pyqtSignal(object)  # Worker thread -> main thread
+        export_finished = pyqtSignal(object)  # ExportWorker -> main thread
     
-    def __init__(self, config_path=None, debug=False, app=None):
+    def __init__(self, config_path=None, debug=False, app=None, splash=None):
         """
         Initialize the application
         
@@ -220,6 +485,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             config_path: Optional path to config file
             debug: Enable debug output
             app: Optional QApplication instance (if already created for splash)
+            splash: Optional splash screen; settings auto-open when it finishes
         """
         if PYQT5_AVAILABLE:
             super().__init__()
@@ -227,9 +493,28 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         self.debug = debug
         self.config_path = config_path
         self.app = app  # Store app if provided
+        self.splash = splash
+        self._startup_settings_shown = False  # See _show_settings_after_splash
         self._last_notification_scale = 1.0
         self._last_prompt_scale = 1.0
         self.pending_paste_part = "" # Track multi-part message remainder text
+        self._notif = None  # Cached notification settings (see _refresh_notification_cache)
+        self._notif_enabled_by_type = {}
+        self._sound_enabled = {}  # Cached '<type>_sound' UI flags
+        self._screen_rect = None  # Cached primary screen available geometry
+        self._notif_pool = []  # Reusable notification widgets
+        self._notif_renderer = None  # Off-screen widget for _render_notification_pixmap
+        self._notif_pixmaps = {}  # (title, message, theme, scale) -> rendered QPixmap
+        self._active_notifications = []  # Visible notifications (prevents garbage collection)
+        self._config_dirty = False  # Config has unsaved changes (see _mark_config_dirty)
+        self._config_flush_pending = False  # A debounced save is scheduled
+        self._config_save_lock = threading.Lock()  # Serializes config file writes
+        self._router_lock = threading.RLock()  # Held while processing and while settings swap router state
+        self._config_save_seq = 0  # Bumped per save; stale background writes are skipped
+        self._config_written_seq = 0  # Seq of the last save that reached disk
+        self._last_saved_config = None  # Copy of the config as last loaded/saved
+        self._safe_restart_args = _sanitize_restart_args(sys.argv)  # Used by restart_application
+        self._shutdown_event = threading.Event()  # Ends the console-mode wait in run()
         
         # Create debug window
         if PYQT5_AVAILABLE:
@@ -250,67 +535,227 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         self.force_hotkey = None
         self.toggle_hotkey = None  # Hotkey to toggle optimization hotkeys on/off
         self.clipboard = None
+        self.filter_loader = None
         
         # UI components
         self.manual_overlay = None  # Renamed from strict_overlay
         # permissive_feedback removed - no longer used
         self.tray_icon = None
+        self.toggle_hotkeys_action = None  # Tray "Enable Hotkeys" checkbox
+        self.settings_dialog_instance = None  # Kept hidden for reuse after first open
+        self._tray_menu_populated = False  # Tray menu actions built (see _populate_tray_menu_once)
+        self._mode_actions = []  # Checkable tray actions, data() = setting value
+        self._style_actions = []
+        self._window_actions = []
         
         # State
         self.running = False
         self.processing_hotkey = False  # Prevent re-entrant calls
+        self._pending_hotkey_mode: Optional[bool] = None  # Last press received while busy
         self.hotkeys_enabled = True  # Whether optimization hotkeys are currently enabled
         
+        # Sound files resolved once (None if missing -> system beep)
+        self._sound_files = {}
+        for sound_type in ('notification', 'prompt'):
+            sound_file = os.path.join(
+                os.path.dirname(__file__),
+                'resources',
+                'sounds',
+                f'{sound_type}.wav'
+            )
+            self._sound_files[sound_type] = sound_file if os.path.exists(sound_file) else None
+        
         self.log("COCK Profanity Processor starting...")
 
-    def log(self, message):
-        """Log message to console and debug window"""
-        debug_msg = f"[DEBUG] {message}"
+    def log(self, message, *args):
+        """
+        Log message to console and debug window
         
-        # Always print to stdout
+        Skipped entirely (no formatting) unless debug output is on or the
+        debug window is visible; with debug on, lines reach the window even
+        while it is hidden. Extra args are %-formatted into message.
+        """
+        debug_window = self.debug_window
+        window_visible = bool(debug_window) and debug_window.isVisible()
+        if not self.debug and not window_visible:
+            return
+        
+        if args:
+            message = message % args
+        debug_msg = "[DEBUG] " + str(message)
+        
+        # Print to stdout in debug mode
         if self.debug:
             print(debug_msg)
         
-        # Also send to debug window if it exists
-        if hasattr(self, 'debug_window') and self.debug_window:
-            self.debug_window.append_text(debug_msg)
+        # Also send to debug window (buffered while hidden in debug mode, so
+        # opening the console later still shows the history)
+        if debug_window:
+            debug_window.append_text(debug_msg)
+    
+    def _refresh_notification_cache(self):
+        """Snapshot notification settings from config (call whenever config changes)"""
+        config = self.config or {}
+        notifications_config = config.get('notifications', {})
+        ui_config = config.get('ui', {})
+        
+        self._notif = types.SimpleNamespace(
+            enabled=notifications_config.get('enabled', True),
+            show_clean=notifications_config.get('show_clean_messages', True),
+            show_optimized=notifications_config.get('show_optimized_messages', True),
+            duration_ms=notifications_config.get('duration_ms', 2000),  # Default 2 seconds
+            scale=ui_config.get('notification_scale', 1.0),
+            theme=ui_config.get('theme', 'dark'),
+            position=ui_config.get('notification_position', 'bottom-right'),
+            offset_x=ui_config.get('notification_offset_x', 20),
+            offset_y=ui_config.get('notification_offset_y', 20)
+        )
+        
+        # Whether each notification type is shown (unknown types count as 'info')
+        notif = self._notif
+        self._notif_enabled_by_type = {
+            'clean': notif.enabled and notif.show_clean,
+            'optimized': notif.enabled and notif.show_optimized,
+            'info': notif.enabled
+        }
+        
+        # Sound toggles checked by play_sound on every notification
+        self._sound_enabled = {
+            'notification': ui_config.get('notification_sound', True),
+            'prompt': ui_config.get('prompt_sound', True)
+        }
+    
+    def save_config(self):
+        """Save current config to disk and refresh cached settings"""
+        self._config_dirty = False
+        self._refresh_notification_cache()
+        
+        # Nothing changed since the last load/save - skip rewriting the file
+        if self.config == self._last_saved_config:
+            return True
+        
+        self._last_saved_config = copy.deepcopy(self.config)
+        with self._config_save_lock:
+            self._config_save_seq += 1
+            self._config_written_seq = self._config_save_seq
+            return self.config_loader.save(self.config)
+    
+    def _mark_config_dirty(self, delay_ms: int = 500):
+        """
+        Schedule a debounced config save
+        
+        Repeated calls within delay_ms collapse into a single write.
+        Without Qt there is no event loop, so the config is saved immediately.
+        """
+        # Settings changed in place - refresh the router's limits and cached results
+        if self.router:
+            with self._router_lock:
+                self.router.update_config(self.config)
+        
+        if not PYQT5_AVAILABLE:
+            self.save_config()
+            return
+        
+        self._config_dirty = True
+        self._refresh_notification_cache()
+        if not self._config_flush_pending:
+            self._config_flush_pending = True
+            QTimer.singleShot(delay_ms, self._flush_config_async)
+    
+    def _flush_config(self):
+        """
+        Write config to disk now if a debounced or background save is pending
+        
+        Returns only once the file is current, so callers can exit, restart
+        or reload the file right after.
+        """
+        self._config_flush_pending = False
+        if self._config_dirty:
+            self.save_config()
+        
+        # A ConfigSaveWorker may still be queued - write its snapshot here instead
+        with self._config_save_lock:
+            if self._config_save_seq != self._config_written_seq:
+                self._config_save_seq += 1  # Makes the queued worker skip
+                self._config_written_seq = self._config_save_seq
+                self.config_loader.save(self._last_saved_config)
+    
+    def _flush_config_async(self):
+        """Debounce timer callback: write the pending config from the thread pool"""
+        self._config_flush_pending = False
+        if not self._config_dirty:
+            return
+        
+        self._config_dirty = False
+        if self.config == self._last_saved_config:
+            return  # Changes were reverted before the timer fired
+        
+        # Snapshot so later setters can't mutate the dict mid-dump
+        self._last_saved_config = copy.deepcopy(self.config)
+        self._config_save_seq += 1
+        worker = ConfigSaveWorker(self, self._last_saved_config, self._config_save_seq)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _write_config_snapshot(self, snapshot, seq):
+        """
+        Write a config snapshot (runs on a pool thread)
+        
+        Args:
+            snapshot: Deep copy of the config taken on the main thread
+            seq: Save sequence number the snapshot was taken at
+        """
+        with self._config_save_lock:
+            if seq != self._config_save_seq:
+                return  # A newer save already ran or is queued
+            self._config_written_seq = seq
+            self.config_loader.save(snapshot)
     
     def initialize(self):
         """Initialize all modules"""
         try:
+            _import_core_modules()
+            
             # Phase 1: Core system
             self.log("Initializing core system...")
             
             # Load configuration
             config_path = self.config_path or path_manager.get_data_file('config.json')
-            self.log(f"Loading config from: {config_path}")
+            self.log("Loading config from: %s", config_path)
             
             # Use ConfigLoader class
             self.config_loader = config_loader.ConfigLoader(config_path)
             self.config = self.config_loader.load()
+            self._last_saved_config = copy.deepcopy(self.config)
             
-            self.log(f"Config loaded successfully")
+            self.log("Config loaded successfully")
             
             # Check permissions
             permissions = permission_manager.check_permissions()
             
-            # Check clipboard (tuple with (status, message))
-            if not permissions.get('clipboard', (False, ""))[0]:
+            # Check clipboard
+            if not permissions.clipboard.granted:
                 print("WARNING: Clipboard access may be restricted")
             
-            # Check keyboard (tuple with (status, message))
-            if not permissions.get('keyboard', (False, ""))[0]:
+            # Check keyboard
+            if not permissions.keyboard.granted:
                 print("WARNING: Keyboard access may be restricted")
                 print("  Global hotkeys may not work without keyboard module")
             
             # Admin is optional - just log status
-            if permissions.get('admin', (False, ""))[0]:
+            if permissions.admin.granted:
                 self.log("Running with administrator privileges")
             
             # Initialize clipboard manager
             try:
                 self.clipboard = clipboard_manager.ClipboardManager(self.config)
                 self.log("Clipboard manager initialized")
+                
+                # The permission check only confirms pyperclip is installed - try a real read
+                if permissions.clipboard.granted:
+                    clipboard_status = permission_manager.check_clipboard_runtime()
+                    if not clipboard_status.granted:
+                        print("WARNING: Clipboard access may be restricted")
+                        print(f"  {clipboard_status.message}")
             except Exception as e:
                 print(f"WARNING: Clipboard manager initialization failed: {e}")
                 print("  Clipboard capture may not work")
@@ -332,12 +777,23 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                     print(f"ERROR: Filter file too large ({file_size} bytes). Maximum: {max_size} bytes")
                     return False
                 
-                with open(filter_path, 'r', encoding='utf-8') as test_file:
-                    for i, line in enumerate(test_file):
-                        if i >= 1000:
-                            break
-                        if len(line.strip()) > constants.MAX_FILTER_LINE_LENGTH:
-                            print(f"WARNING: Filter file contains very long lines (line {i+1})")
+                if file_size > 0:
+                    with open(filter_path, 'rb') as test_file, \
+                            mmap.mmap(test_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # Check encoding of the whole file in 64KB chunks (no full decoded copy)
+                        decoder = codecs.getincrementaldecoder('utf-8')()
+                        for start in range(0, len(mm), 65536):
+                            decoder.decode(mm[start:start + 65536])
+                        decoder.decode(b'', final=True)
+                        
+                        # Scan the first 1000 lines as raw bytes (no per-line decoding)
+                        max_len = constants.MAX_FILTER_LINE_LENGTH
+                        for i, line in enumerate(itertools.islice(iter(mm.readline, b''), 1000)):
+                            # Raw length minus the line ending, without a stripped copy
+                            length = len(line) - (2 if line.endswith(b'\r\n') else 1 if line.endswith(b'\n') else 0)
+                            # Byte length >= stripped char length, so only decode candidates
+                            if length > max_len and len(line.decode('utf-8', 'replace').strip()) > max_len:
+                                print(f"WARNING: Filter file contains very long lines (line {i+1})")
                             
             except UnicodeDecodeError as e:
                 print(f"ERROR: Filter file has invalid encoding: {e}")
@@ -346,9 +802,6 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                 print(f"ERROR: Filter file validation failed: {e}")
                 return False
             
-            loader = filter_loader.FilterLoader()
-            filter_path = self.config.get('filter_file')
-            
             loader = filter_loader.FilterLoader()
             self.automaton, stats = loader.load(filter_path, verbose=self.debug)
             
@@ -362,7 +815,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             # Store stats for settings dialog
             self.filter_stats = stats
             
-            self.log(f"Loaded {stats['final_count']} filter words in {stats['load_time_ms']:.1f}ms")
+            self.log("Loaded %d filter words in %.1fms", stats['final_count'], stats['load_time_ms'])
             
             # Phase 2: Detection engine
             self.log("Initializing detection engine...")
@@ -396,13 +849,14 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             )
             
             self.optimizer = message_optimizer.MessageOptimizer(
-                self.detector, self.leet, self.fancy, self.shorthand, self.config
+                self.detector, self.leet, self.fancy, self.shorthand, self.config,
+                debug=self.debug
             )
             
             # Mode router
             self.router = mode_router.ModeRouter(
                 self.config, self.detector, self.optimizer,
-                self.wl_manager
+                self.wl_manager, debug=self.debug
             )
             
             # Phase 4: Update and help systems
@@ -418,6 +872,8 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             
             # Phase 5: UI will be initialized in run() after QApplication is created
             
+            self._refresh_notification_cache()
+            
             self.log("All modules initialized successfully")
             return True
             
@@ -431,22 +887,14 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         """Setup global hotkeys"""
         try:
             # Get normal hotkey combo from config
-            hotkey_config = self.config.get('hotkey', 'ctrl+shift+v')
+            # (old dict format is normalized to a string by config_loader.load())
+            hotkey_combo = self.config.get('hotkey', 'ctrl+shift+v')
             
-            if isinstance(hotkey_config, dict):
-                # Old format
-                hotkey_combo = hotkey_config.get('combo', 'ctrl+shift+v')
-            else:
-                # New format (string)
-                hotkey_combo = hotkey_config
+            self.log("Registering normal hotkey: %s", hotkey_combo)
             
-            self.log(f"Registering normal hotkey: {hotkey_combo}")
-            
-            # Create HotkeyHandler with hotkey and callback wrapper
-            self.hotkey = hotkey_handler.HotkeyHandler(hotkey_combo, self.on_hotkey_pressed_callback)
-            
-            # Start listening
-            if not self.hotkey.start():
+            # Create (or reuse) HotkeyHandler with hotkey and callback wrapper, and start listening
+            self.hotkey, started = self._start_hotkey(self.hotkey, hotkey_combo, self.on_hotkey_pressed_callback)
+            if not started:
                 print(f"WARNING: Could not register hotkey: {hotkey_combo}")
                 print("  Hotkey may already be in use by another application")
                 return False
@@ -455,11 +903,12 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             
             # Setup force optimize hotkey
             force_hotkey_combo = self.config.get('force_optimize_hotkey', 'shift+f12')
-            self.log(f"Registering force optimize hotkey: {force_hotkey_combo}")
+            self.log("Registering force optimize hotkey: %s", force_hotkey_combo)
             
-            self.force_hotkey = hotkey_handler.HotkeyHandler(force_hotkey_combo, self.on_force_hotkey_pressed_callback)
-            
-            if not self.force_hotkey.start():
+            self.force_hotkey, started = self._start_hotkey(
+                self.force_hotkey, force_hotkey_combo, self.on_force_hotkey_pressed_callback
+            )
+            if not started:
                 print(f"WARNING: Could not register force optimize hotkey: {force_hotkey_combo}")
                 print("  Hotkey may already be in use by another application")
                 # Continue anyway - normal hotkey still works
@@ -468,14 +917,13 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             
             # Setup toggle hotkeys hotkey (ALWAYS active - controls enable/disable of other hotkeys)
             toggle_hotkey_combo = self.config.get('toggle_hotkeys_hotkey', 'ctrl+shift+h')
-            if isinstance(toggle_hotkey_combo, dict):
-                toggle_hotkey_combo = toggle_hotkey_combo.get('combo', 'ctrl+shift+h')
             
-            self.log(f"Registering toggle hotkeys hotkey: {toggle_hotkey_combo}")
+            self.log("Registering toggle hotkeys hotkey: %s", toggle_hotkey_combo)
             
-            self.toggle_hotkey = hotkey_handler.HotkeyHandler(toggle_hotkey_combo, self.on_toggle_hotkey_pressed_callback)
-            
-            if not self.toggle_hotkey.start():
+            self.toggle_hotkey, started = self._start_hotkey(
+                self.toggle_hotkey, toggle_hotkey_combo, self.on_toggle_hotkey_pressed_callback
+            )
+            if not started:
                 print(f"WARNING: Could not register toggle hotkeys hotkey: {toggle_hotkey_combo}")
                 print("  Hotkey may already be in use by another application")
             else:
@@ -500,6 +948,41 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             print(f"ERROR: Hotkey setup failed: {e}")
             return False
     
+    def _start_hotkey(self, handler, combo, callback):
+        """
+        Start listening for combo, reusing an existing HotkeyHandler if given
+        
+        Reusing the handler (instead of constructing a new one on every
+        setup_hotkey call) keeps a still-active hotkey from being registered
+        with the keyboard hook a second time.
+        
+        Returns:
+            tuple: (handler, started)
+        """
+        if handler is None:
+            handler = hotkey_handler.HotkeyHandler(combo, callback)
+        elif handler.get_hotkey() != combo:
+            # Restarts the handler with the new combo if it was running
+            handler.change_hotkey(combo)
+        
+        started = handler.is_active() or handler.start()
+        return handler, started
+    
+    def notifications_enabled(self, notification_type: str = 'info') -> bool:
+        """
+        Check (from the cached settings) whether a notification would be shown
+        
+        Callers building formatted messages can check this first and skip
+        the formatting when the notification would be dropped anyway.
+        
+        Args:
+            notification_type: 'clean', 'optimized', or 'info'
+            
+        Returns:
+            bool: True if notifications of this type are enabled
+        """
+        return self._notif_enabled_by_type.get(notification_type, self._notif.enabled)
+    
     def show_notification(self, title: str, message: str, notification_type: str = 'info', duration: int = None):
         """
         Show a brief notification popup
@@ -510,143 +993,51 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             notification_type: 'clean', 'optimized', or 'info'
             duration: Optional duration in milliseconds (overrides config if provided)
         """
-        if not PYQT5_AVAILABLE:
-            return
-        
         # Check if notifications are enabled for this type
-        notifications_config = self.config.get('notifications', {})
-        enabled = notifications_config.get('enabled', True)
-        
-        # Check specific type settings
-        if notification_type == 'clean':
-            enabled = notifications_config.get('show_clean_messages', True)
-        elif notification_type == 'optimized':
-            enabled = notifications_config.get('show_optimized_messages', True)
+        if not self.notifications_enabled(notification_type):
+            return
         
-        if not enabled:
+        if not PYQT5_AVAILABLE:
             return
         
+        notif = self._notif
+        
         # Get duration from parameter or config
         if duration is None:
-            duration_ms = notifications_config.get('duration_ms', 2000)  # Default 2 seconds
+            duration_ms = notif.duration_ms
         else:
             duration_ms = duration
         
         try:
-            from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
-            from PyQt5.QtCore import QTimer, Qt
-            from PyQt5.QtGui import QFont
-            
-            # Create custom notification widget
-            notification = QWidget()
-            notification.setWindowFlags(
-                Qt.WindowStaysOnTopHint | 
-                Qt.FramelessWindowHint | 
-                Qt.Tool
-            )
-            notification.setAttribute(Qt.WA_TranslucentBackground)
-            notification.setAttribute(Qt.WA_ShowWithoutActivating)
+            # Rendered once per unique (title, message, theme, scale)
+            pixmap = self._render_notification_pixmap(title, message, notif.theme, notif.scale)
             
-            layout = QVBoxLayout()
-            
-            # Get scaling factor
-            scale = self.config.get('ui', {}).get('notification_scale', 1.0)
-            
-            # Title label
-            title_label = QLabel(title)
-            title_font = QFont()
-            title_font.setBold(True)
-            title_font.setPointSize(int(10 * scale))
-            title_label.setFont(title_font)
-            layout.addWidget(title_label)
-            
-            # Message label
-            message_label = QLabel(message)
-            message_label.setWordWrap(True)
-            message_font = QFont()
-            message_font.setPointSize(int(9 * scale))
-            message_label.setFont(message_font)
-            layout.addWidget(message_label)
-            
-            # Apply padding scale
-            padding = int(12 * scale)
-            layout.setContentsMargins(padding, padding, padding, padding)
-            layout.setSpacing(int(8 * scale))
-            
-            notification.setLayout(layout)
-            
-            # Style based on theme
-            theme = self.config.get('ui', {}).get('theme', 'dark')
-            if theme == 'dark':
-                notification.setStyleSheet("""
-                    QWidget {
-                        background-color: #2b2b2b;
-                        color: white;
-                        border: 2px solid #555;
-                        border-radius: 8px;
-                        padding: 10px;
-                    }
-                """)
+            # Reuse a pooled popup (build a new one if all are in use)
+            if self._notif_pool:
+                notification = self._notif_pool.pop()
             else:
-                notification.setStyleSheet("""
-                    QWidget {
-                        background-color: #f0f0f0;
-                        color: black;
-                        border: 2px solid #ccc;
-                        border-radius: 8px;
-                        padding: 10px;
-                    }
-                """)
+                notification = _build_notification_popup()
+            notification.setPixmap(pixmap)
             
             # Position in bottom-right corner
-            from PyQt5.QtWidgets import QDesktopWidget
-            desktop = QDesktopWidget()
-            screen_rect = desktop.availableGeometry()
+            if self._screen_rect is None:
+                self._update_screen_rect()
+            screen_rect = self._screen_rect
             
             notification.adjustSize()
             
             # Get position and offsets from config
-            position = self.config.get('ui', {}).get('notification_position', 'bottom-right')
-            offset_x = self.config.get('ui', {}).get('notification_offset_x', 20)
-            offset_y = self.config.get('ui', {}).get('notification_offset_y', 20)
-            
-            # Calculate position based on config (with 9 presets)
-            if position == 'top-left':
-                x = offset_x
-                y = offset_y
-            elif position == 'top-center':
-                x = (screen_rect.width() - notification.width()) // 2 + offset_x
-                y = offset_y
-            elif position == 'top-right':
-                x = screen_rect.width() - notification.width() - offset_x
-                y = offset_y
-            elif position == 'center-left':
-                x = offset_x
-                y = (screen_rect.height() - notification.height()) // 2 + offset_y
-            elif position == 'center':
-                x = (screen_rect.width() - notification.width()) // 2 + offset_x
-                y = (screen_rect.height() - notification.height()) // 2 + offset_y
-            elif position == 'center-right':
-                x = screen_rect.width() - notification.width() - offset_x
-                y = (screen_rect.height() - notification.height()) // 2 + offset_y
-            elif position == 'bottom-left':
-                x = offset_x
-                y = screen_rect.height() - notification.height() - offset_y
-            elif position == 'bottom-center':
-                x = (screen_rect.width() - notification.width()) // 2 + offset_x
-                y = screen_rect.height() - notification.height() - offset_y
-            elif position == 'bottom-right':
-                x = screen_rect.width() - notification.width() - offset_x
-                y = screen_rect.height() - notification.height() - offset_y
-            else:  # fallback to center
-                x = (screen_rect.width() - notification.width()) // 2 + offset_x
-                y = (screen_rect.height() - notification.height()) // 2 + offset_y
+            position = notif.position
+            offset_x = notif.offset_x
+            offset_y = notif.offset_y
+            
+            # Calculate position based on config (with 9 presets, fallback to center)
+            position_func = POSITION_FUNCS.get(position, POSITION_FUNCS['center'])
+            x, y = position_func(screen_rect, notification.width(), notification.height(), offset_x, offset_y)
             
             notification.move(x, y)
             
             # Store reference to prevent garbage collection
-            if not hasattr(self, '_active_notifications'):
-                self._active_notifications = []
             self._active_notifications.append(notification)
 
             # Play notification sound if enabled
@@ -659,27 +1050,78 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                 notification.close()
                 if notification in self._active_notifications:
                     self._active_notifications.remove(notification)
+                # Return widget to the pool for the next notification
+                if len(self._notif_pool) < NOTIFICATION_POOL_SIZE:
+                    self._notif_pool.append(notification)
             
             if duration_ms > 0:
                 QTimer.singleShot(duration_ms, close_and_cleanup)
             
         except Exception as e:
-            self.log(f"Failed to show notification: {e}")
-            import traceback
+            self.log("Failed to show notification: %s", e)
             traceback.print_exc()
     
+    def _render_notification_pixmap(self, title: str, message: str, theme: str, scale: float):
+        """
+        Lay out and rasterize a notification once per unique content
+        
+        Repeated notifications (e.g. "Clean Message Sent") skip Qt's layout and
+        text shaping entirely and just show the cached pixmap.
+        
+        Returns:
+            QPixmap: Rendered notification
+        """
+        key = (title, message, theme, scale)
+        pixmap = self._notif_pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+        
+        if self._notif_renderer is None:
+            self._notif_renderer = _build_notification_widget()
+        
+        renderer = self._notif_renderer
+        _style_notification_widget(renderer, theme, scale)
+        renderer.title_label.setText(title)
+        renderer.message_label.setText(message)
+        renderer.adjustSize()
+        pixmap = renderer.grab()
+        
+        # Bounded cache - drop the oldest entry
+        if len(self._notif_pixmaps) >= NOTIFICATION_PIXMAP_CACHE_SIZE:
+            del self._notif_pixmaps[next(iter(self._notif_pixmaps))]
+        self._notif_pixmaps[key] = pixmap
+        return pixmap
+    
+    def _release_notification_cache(self):
+        """Drop the notification renderer and cached pixmaps (before QApplication goes away)"""
+        self._notif_pixmaps.clear()
+        if self._notif_renderer is not None:
+            self._notif_renderer.deleteLater()
+            self._notif_renderer = None
+    
     def init_ui(self):
         """Initialize UI components (must be called after QApplication is created)"""
         if not PYQT5_AVAILABLE:
             return
         
         try:
+            _import_ui_modules()
+            
             self.log("Initializing UI components...")
             
             # Connect hotkey signals to handlers (thread-safe)
             self.hotkey_pressed.connect(self.on_hotkey_triggered)
             self.force_hotkey_pressed.connect(self.on_force_hotkey_triggered)
             self.toggle_hotkey_pressed.connect(self.toggle_hotkeys)
+            self.hotkey_processed.connect(self._on_hotkey_processed)
+            self.export_finished.connect(self._on_export_finished)
+            
+            # Cache screen geometry for notification positioning (refreshed on change)
+            self._on_primary_screen_changed(QApplication.primaryScreen())
+            self.app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+            
+            # Pre-build notification widgets so hotkey presses don't construct them
+            self._notif_pool = [_build_notification_popup() for _ in range(NOTIFICATION_POOL_SIZE)]
             
             # Create manual overlay
             self.manual_overlay = overlay_manual.ManualModeOverlay(self.config)
@@ -696,9 +1138,17 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         
         except Exception as e:
             print(f"WARNING: UI initialization failed: {e}")
-            import traceback
             traceback.print_exc()
     
+    def _on_primary_screen_changed(self, screen):
+        """Track geometry changes of the (new) primary screen"""
+        screen.availableGeometryChanged.connect(self._update_screen_rect)
+        self._update_screen_rect()
+    
+    def _update_screen_rect(self, *_):
+        """Refresh cached primary screen available geometry"""
+        self._screen_rect = QApplication.primaryScreen().availableGeometry()
+    
     def on_hotkey_pressed_callback(self):
         """
         Callback from keyboard library (runs in keyboard thread)
@@ -748,9 +1198,9 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         """Toggle optimization hotkeys on/off"""
         self.hotkeys_enabled = not self.hotkeys_enabled
         
-        # Update config
+        # Update config (debounced - toggle may be pressed repeatedly)
         self.config['hotkeys_enabled'] = self.hotkeys_enabled
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
         
         if self.hotkeys_enabled:
             # Enable hotkeys
@@ -762,13 +1212,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             self.log("Hotkeys ENABLED")
             
             # Show notification
-            if PYQT5_AVAILABLE and hasattr(self, 'tray_icon') and self.tray_icon:
-                self.tray_icon.showMessage(
-                    "COCK Profanity Processor",
-                    "Hotkeys Enabled",
-                    self.tray_icon.icon(),
-                    2000
-                )
+            self._tray_notify("COCK Profanity Processor", "Hotkeys Enabled")
         else:
             # Disable hotkeys
             if self.hotkey and self.hotkey.is_active():
@@ -779,47 +1223,95 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             self.log("Hotkeys DISABLED")
             
             # Show notification
-            if PYQT5_AVAILABLE and hasattr(self, 'tray_icon') and self.tray_icon:
-                self.tray_icon.showMessage(
-                    "COCK Profanity Processor",
-                    "Hotkeys Disabled",
-                    self.tray_icon.icon(),
-                    2000
-                )
+            self._tray_notify("COCK Profanity Processor", "Hotkeys Disabled")
         
         # Update tray menu checkmark
-        if hasattr(self, 'toggle_hotkeys_action'):
+        if self.toggle_hotkeys_action:
             self.toggle_hotkeys_action.setChecked(self.hotkeys_enabled)
     
     def on_hotkey_triggered(self, force_mode=False):
         """
         Handle hotkey press
         
+        Clipboard capture and detection run on a worker thread (see
+        HotkeyWorker) so the event loop keeps running; the result comes back
+        to the main thread in _on_hotkey_processed().
+        
         Args:
             force_mode: If True, apply force optimization to all words
         """
-        # Prevent re-entrant calls
+        # Prevent re-entrant calls - remember the latest press and replay it
+        # once the current one finishes (intermediate presses are coalesced)
         if self.processing_hotkey:
-            self.log("Hotkey already being processed, ignoring")
+            self.log("Hotkey already being processed, queued (force_mode=%s)", force_mode)
+            self._pending_hotkey_mode = force_mode
             return
         
         self.processing_hotkey = True
-        self.log(f"Hotkey triggered! (force_mode={force_mode})")
+        self.log("Hotkey triggered! (force_mode=%s)", force_mode)
         
-        try:
-            # Small delay to ensure modifier keys (Shift, Ctrl, Alt) are fully released
-            # This prevents Shift+Ctrl+A instead of Ctrl+A
-            import time
+        # Capture text from active window using clipboard manager
+        if not self.clipboard:
+            print("ERROR: Clipboard manager not initialized")
+            self.processing_hotkey = False
+            return
+        
+        self.log("Capturing text from active window...")
+        
+        # Small delay to ensure modifier keys (Shift, Ctrl, Alt) are fully released
+        # This prevents Shift+Ctrl+A instead of Ctrl+A
+        if PYQT5_AVAILABLE:
+            QTimer.singleShot(50, lambda: QThreadPool.globalInstance().start(HotkeyWorker(self, force_mode)))
+        else:
             time.sleep(0.05)  # 50ms delay
+            self._on_hotkey_processed(self._capture_and_process(force_mode))
+    
+    def _capture_and_process(self, force_mode):
+        """
+        Capture text from the active window and run it through the router
+        
+        Runs on a worker thread when Qt is available, so it must not touch
+        any widgets (including the debug window via self.log).
+        
+        Returns:
+            tuple: (force_mode, text, result, error) - result is None if the
+                   text was not processed, error is any exception raised
+        """
+        try:
+            # Oversized captures are cut at the clipboard boundary (to MAX + 1 chars)
+            text = self.clipboard.capture_with_backup(max_len=constants.MAX_CLIPBOARD_CAPTURE_LENGTH)
             
-            # Capture text from active window using clipboard manager
-            if not self.clipboard:
-                print("ERROR: Clipboard manager not initialized")
-                return
+            # Empty or suspiciously long captures are reported by the caller
+            if not text or len(text) > constants.MAX_CLIPBOARD_CAPTURE_LENGTH:
+                return (force_mode, text, None, None)
             
-            self.log("Capturing text from active window...")
-            text = self.clipboard.capture_with_backup()
-            self.log(f"Capture complete: {len(text) if text else 0} chars")
+            # Process message through router (settings can't swap its state mid-run)
+            with self._router_lock:
+                if force_mode:
+                    result = self.router.process_force_optimize(text)
+                else:
+                    result = self.router.process_message(text)
+            
+            return (force_mode, text, result, None)
+        except Exception as e:
+            return (force_mode, None, None, e)
+    
+    def _on_hotkey_processed(self, payload):
+        """
+        Act on a processed hotkey capture (paste, send, UI) on the main thread
+        
+        Args:
+            payload: Tuple returned by _capture_and_process()
+        """
+        force_mode, text, result, error = payload
+        cfg = self.config  # One snapshot for the whole press (incl. delayed remainder paste)
+        paste_scheduled = False  # Remainder paste pending - it releases the hotkey guard
+        
+        try:
+            if error is not None:
+                raise error
+            
+            self.log("Capture complete: %s chars", len(text) if text else 0)
             
             if not text:
                 self.log("No text captured from active window")
@@ -828,29 +1320,23 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             # Sanity check: warn if captured text is suspiciously long
             # Normal chat messages are rarely over 500 chars
             if len(text) > constants.MAX_CLIPBOARD_CAPTURE_LENGTH:
-                self.log(f"WARNING: Captured {len(text)} chars - likely captured from WRONG WINDOW!")
+                self.log("WARNING: Captured over %s chars - likely captured from WRONG WINDOW!",
+                         constants.MAX_CLIPBOARD_CAPTURE_LENGTH)
                 self.log("Make sure the GAME CHAT WINDOW has focus, not the console!")
-                self.show_notification(
-                    "⚠️ Wrong Window!",
-                    f"Captured {len(text)} chars from console/wrong window!\n" +
-                    "Click game chat window and try again.",
-                    notification_type='optimized'
-                )
+                if self.notifications_enabled('optimized'):
+                    self.show_notification(
+                        "⚠️ Wrong Window!",
+                        f"Captured over {constants.MAX_CLIPBOARD_CAPTURE_LENGTH} chars from console/wrong window!\n" +
+                        "Click game chat window and try again.",
+                        notification_type='optimized'
+                    )
                 return
             
-            self.log(f"Captured: {text[:50]}...")
-            
-            # Process message through router
-            self.log("Processing message...")
-            if force_mode:
-                result = self.router.process_force_optimize(text)
-            else:
-                result = self.router.process_message(text)
-            
-            self.log(f"Processing result: {result.action}")
+            self.log("Captured: %.50s...", text)
+            self.log("Processing result: %s", result.action)
             
             # Handle based on action
-            if result.action == 'send':
+            if result.action == mode_router.ACTION_SEND:
                 # Clean message - send it
                 self.log("Message is clean - sending")
                 
@@ -861,7 +1347,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                     self.log("Clean message sent")
                     
                     # Clear clipboard
-                    self.clipboard.copy_to_clipboard("")
+                    self.clipboard.clear()
                     
                     # Show notification
                     self.show_notification(
@@ -870,15 +1356,15 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                         notification_type='clean'
                     )
                 
-            elif result.action == 'manual':
+            elif result.action == mode_router.ACTION_MANUAL:
                 # Manual mode - show UI
                 if PYQT5_AVAILABLE and self.manual_overlay:
                     self.log("Showing manual mode overlay")
                     try:
-                        self.log(f"Overlay object exists: {self.manual_overlay is not None}")
-                        self.log(f"Flagged words: {result.flagged_words}")
-                        self.log(f"Suggested: {result.suggested}")
-                        self.log(f"Paste part: {result.paste_part}")
+                        self.log("Overlay object exists: %s", self.manual_overlay is not None)
+                        self.log("Flagged words: %s", result.flagged_words)
+                        self.log("Suggested: %s", result.suggested)
+                        self.log("Paste part: %s", result.paste_part)
                         
                         # Store paste_part for later use
                         self.pending_paste_part = result.paste_part if result.paste_part else ""
@@ -898,10 +1384,10 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                     if result.suggested:
                         print(f"Suggested: {result.suggested}")
                 
-            elif result.action == 'optimize':
+            elif result.action == mode_router.ACTION_OPTIMIZE:
                 # Auto mode or force mode - auto-optimized
                 if result.suggested:
-                    self.log(f"Optimized text: {result.suggested}")
+                    self.log("Optimized text: %s", result.suggested)
                     
                     # Paste optimized text
                     self.log("Pasting optimized text...")
@@ -911,54 +1397,32 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                         # Check if multi-part message
                         if result.paste_part:
                             # Message split - send first part, paste remainder
-                            self.log(f"Multi-part message: sending part, pasting remainder ({len(result.paste_part)} chars)")
-                            
-                            # Send first part
-                            self.clipboard.send_message()
-                            self.log("First part sent")
-                            
-                            # Brief delay
-                            import time
-                            delay_ms = self.config.get('multipart_paste_delay_ms', 100)
-                            time.sleep(delay_ms / 1000.0)
-                            
-                            # Paste remainder (DON'T send)
-                            self.log(f"Pasting remainder: {result.paste_part[:50]}...")
-                            if self.clipboard.paste_text(result.paste_part):
-                                self.log("Remainder pasted successfully")
-                                
-                                # Clear clipboard to prevent contamination on next capture
-                                self.log("Clearing clipboard...")
-                                self.clipboard.copy_to_clipboard("")
-                                
-                                # Show notification
-                                hotkey = self.config.get('force_optimize_hotkey' if force_mode else 'hotkey', 'F12')
-                                self.show_notification(
-                                    "Long Message Split",
-                                    f"Message went over length limit!\nPress {hotkey} to send next part",
-                                    notification_type='optimized'
-                                )
-                            else:
-                                self.log("ERROR: Failed to paste remainder")
+                            hotkey = cfg.get('force_optimize_hotkey' if force_mode else 'hotkey', 'F12')
+                            self._send_first_part(
+                                result.paste_part, hotkey,
+                                cfg.get('multipart_paste_delay_ms', 100)
+                            )
+                            paste_scheduled = True
                         else:
                             # Single-part message - send normally
                             self.clipboard.send_message()
                             self.log("Message sent automatically")
                             
                             # Clear clipboard to prevent contamination
-                            self.clipboard.copy_to_clipboard("")
+                            self.clipboard.clear()
                             
                             # Show notification
-                            mode_text = "Force optimized" if force_mode else "Optimized"
-                            self.show_notification(
-                                f"Message {mode_text}",
-                                f"Message was modified before sending",
-                                notification_type='optimized'
-                            )
+                            if self.notifications_enabled('optimized'):
+                                mode_text = "Force optimized" if force_mode else "Optimized"
+                                self.show_notification(
+                                    f"Message {mode_text}",
+                                    "Message was modified before sending",
+                                    notification_type='optimized'
+                                )
                     else:
                         self.log("ERROR: Failed to paste text")
             
-            elif result.action == 'block':
+            elif result.action == mode_router.ACTION_BLOCK:
                 # Could not optimize
                 if PYQT5_AVAILABLE and self.manual_overlay:
                     self.manual_overlay.show_detection(
@@ -974,11 +1438,11 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         except Exception as e:
             print(f"ERROR: Hotkey handler failed: {e}")
             if self.debug:
-                traceback.print_exc()
+                traceback.print_exception(type(e), e, e.__traceback__)
         finally:
-            # Always reset flag
-            self.processing_hotkey = False
-            self.log("Hotkey processing flag reset")
+            # Reset flag now unless the remainder paste still needs the clipboard
+            if not paste_scheduled:
+                self._release_hotkey_guard()
 
     def play_sound(self, sound_type):
         """
@@ -987,112 +1451,167 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         Args:
             sound_type: 'notification' or 'prompt'
         """
-        # Check if sound is enabled in config
-        sound_enabled = self.config.get('ui', {}).get(f'{sound_type}_sound', True)
-        if not sound_enabled:
+        # Check if sound is enabled (cached from config)
+        if not self._sound_enabled.get(sound_type, True) or winsound is None:
             return
         
         try:
-            import winsound
-            import os
-            
-            # Build path to sound file
-            sound_file = os.path.join(
-                os.path.dirname(__file__), 
-                'resources', 
-                'sounds', 
-                f'{sound_type}.wav'
-            )
-            
-            # Play custom sound if file exists
-            if os.path.exists(sound_file):
-                self.log(f"Playing {sound_type} sound: {sound_file}")
+            # Play custom sound if file exists (resolved once in __init__)
+            sound_file = self._sound_files.get(sound_type)
+            if sound_file:
+                self.log("Playing %s sound: %s", sound_type, sound_file)
                 winsound.PlaySound(sound_file, winsound.SND_FILENAME | winsound.SND_ASYNC)
             else:
                 # Fallback to system beep
-                self.log(f"Sound file not found, using system beep: {sound_file}")
+                self.log("Sound file not found, using system beep: %s.wav", sound_type)
                 winsound.MessageBeep(winsound.MB_OK)
                 
         except Exception as e:
-            self.log(f"Could not play {sound_type} sound: {e}")
+            self.log("Could not play %s sound: %s", sound_type, e)
     
     
     def on_use_suggestion(self):
         """Handle manual mode 'use suggestion' action"""
-        self.log("=== on_use_suggestion() CALLED ===")
+        self.log("on_use_suggestion() called")
         
-        # Debug: Check overlay state
-        self.log(f"Has manual_overlay: {hasattr(self, 'manual_overlay')}")
-        if hasattr(self, 'manual_overlay'):
-            self.log(f"Overlay exists: {self.manual_overlay is not None}")
-            if self.manual_overlay:
-                self.log(f"Suggested text: '{self.manual_overlay.suggested_text}'")
-        
-        if not hasattr(self, 'manual_overlay') or not self.manual_overlay.suggested_text:
+        if self.manual_overlay is None or not self.manual_overlay.suggested_text:
             self.log("ERROR: No overlay or no suggested text - ABORTING")
             return
         
         # Store values before closing overlay
         suggested_text = self.manual_overlay.suggested_text
-        paste_part = self.pending_paste_part if hasattr(self, 'pending_paste_part') else ""
+        paste_part = self.pending_paste_part
         
-        self.log(f"Suggested text: '{suggested_text}'")
-        self.log(f"Paste part: '{paste_part}'")
+        self.log("Suggested text: '%s'", suggested_text)
+        self.log("Paste part: '%s'", paste_part)
         
         # Close overlay FIRST
         self.log("Closing overlay...")
         self.manual_overlay.close()
         
-        # Brief delay
-        import time
-        time.sleep(0.1)
-        self.log("Overlay closed, proceeding with paste...")
+        # Give the overlay time to close and focus to return before pasting.
+        # Hold the hotkey guard so no capture touches the clipboard meanwhile.
+        self.pending_paste_part = ""
+        self.processing_hotkey = True
+        self._run_later(100, lambda: self._do_paste_after_overlay_close(suggested_text, paste_part))
+    
+    def _do_paste_after_overlay_close(self, suggested_text, paste_part):
+        """
+        Paste (and send) the accepted manual mode suggestion
         
-        # Paste optimized text
-        self.log(f"Pasting optimized text: '{suggested_text}'")
+        Args:
+            suggested_text: Optimized text to paste
+            paste_part: Remainder of a split message, or empty string
+        """
+        self.log("Overlay closed, proceeding with paste...")
+        paste_scheduled = False  # Remainder paste pending - it releases the hotkey guard
         
-        if self.clipboard.paste_text(suggested_text):
-            self.log("Text pasted successfully")
+        try:
+            # Paste optimized text
+            self.log("Pasting optimized text: '%s'", suggested_text)
             
-            if paste_part:
-                # Multi-part message
-                self.log(f"Multi-part message: sending part, pasting remainder ({len(paste_part)} chars)")
+            if self.clipboard.paste_text(suggested_text):
+                self.log("Text pasted successfully")
                 
-                self.clipboard.send_message()
-                self.log("First part sent")
+                if paste_part:
+                    # Multi-part message
+                    cfg = self.config
+                    self._send_first_part(
+                        paste_part, cfg.get('hotkey', 'F12'),
+                        cfg.get('multipart_paste_delay_ms', 100)
+                    )
+                    paste_scheduled = True
+                else:
+                    # Single-part message
+                    self.clipboard.send_message()
+                    self.log("Message sent from manual mode")
+                    self.clipboard.clear()
+                    
+                    self.show_notification(
+                        "Manual Mode - Sent",
+                        "Optimized message sent",
+                        notification_type='optimized'
+                    )
+            else:
+                self.log("ERROR: Failed to paste text")
+        finally:
+            if not paste_scheduled:
+                self._release_hotkey_guard()
+    
+    def _send_first_part(self, paste_part, hotkey, delay_ms):
+        """
+        Send the already pasted first part of a split message and schedule
+        the remainder paste after the configured multipart delay
+        
+        The caller keeps processing_hotkey set; _paste_remainder releases it.
+        
+        Args:
+            paste_part: Remainder to paste (not sent)
+            hotkey: Hotkey shown in the "press to send next part" notification
+            delay_ms: Delay before pasting the remainder
+        """
+        self.log("Multi-part message: sending part, pasting remainder (%s chars)", len(paste_part))
+        
+        # Send first part
+        self.clipboard.send_message()
+        self.log("First part sent")
+        
+        # Brief delay without blocking the event loop
+        self._run_later(delay_ms, lambda: self._paste_remainder(paste_part, hotkey))
+    
+    def _paste_remainder(self, paste_part, hotkey):
+        """
+        Paste the remainder of a split message (DON'T send)
+        
+        Args:
+            paste_part: Remainder to paste
+            hotkey: Hotkey shown in the notification
+        """
+        self.log("Pasting remainder: %.50s...", paste_part)
+        try:
+            if self.clipboard.paste_text(paste_part):
+                self.log("Remainder pasted successfully")
                 
-                delay_ms = self.config.get('multipart_paste_delay_ms', 100)
-                time.sleep(delay_ms / 1000.0)
+                # Clear clipboard to prevent contamination on next capture
+                self.clipboard.clear()
                 
-                self.log(f"Pasting remainder: {paste_part}...")
-                if self.clipboard.paste_text(paste_part):
-                    self.log("Remainder pasted successfully")
-                    self.clipboard.copy_to_clipboard("")
-                    self.pending_paste_part = ""
-                    
-                    hotkey = self.config.get('hotkey', 'F12')
+                if self.notifications_enabled('optimized'):
                     self.show_notification(
                         "Long Message Split",
                         f"Message went over length limit!\nPress {hotkey} to send next part",
                         notification_type='optimized'
                     )
-                else:
-                    self.log("ERROR: Failed to paste remainder")
             else:
-                # Single-part message
-                self.clipboard.send_message()
-                self.log("Message sent from manual mode")
-                self.clipboard.copy_to_clipboard("")
-                
-                self.show_notification(
-                    "Manual Mode - Sent",
-                    "Optimized message sent",
-                    notification_type='optimized'
-                )
-        else:
-            self.log("ERROR: Failed to paste text")
+                self.log("ERROR: Failed to paste remainder")
+        finally:
+            # The guard was held from the hotkey press / accepted suggestion until now
+            self._release_hotkey_guard()
+    
+    def _release_hotkey_guard(self):
+        """
+        Allow the next hotkey press once nothing is pasting through the clipboard
+        
+        Replays the last press that arrived while the guard was held.
+        """
+        self.processing_hotkey = False
+        self.log("Hotkey processing flag reset")
         
-        self.log("=== on_use_suggestion() COMPLETED ===")
+        if self._pending_hotkey_mode is not None:
+            pending_mode = self._pending_hotkey_mode
+            self._pending_hotkey_mode = None
+            self._run_later(0, lambda m=pending_mode: self.on_hotkey_triggered(m))
+    
+    def _run_later(self, delay_ms, callback):
+        """
+        Run callback after delay_ms without blocking the Qt event loop
+        
+        Falls back to a blocking sleep when running without PyQt5.
+        """
+        if PYQT5_AVAILABLE:
+            QTimer.singleShot(delay_ms, callback)
+        else:
+            time.sleep(delay_ms / 1000.0)
+            callback()
     
     def on_cancelled(self):
         """Handle cancel from strict overlay"""
@@ -1105,162 +1624,23 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             return
         
         try:
-            from PyQt5.QtWidgets import QSystemTrayIcon, QMenu, QAction
-            from PyQt5.QtGui import QIcon
-            
-            # Load custom tray icon
-            icon_path = path_manager.get_resource_file('icons/icon.ico')
-            if os.path.exists(icon_path):
-                icon = QIcon(icon_path)
-            else:
+            # Load custom tray icon once; reused for tray notifications
+            self._tray_qicon = _app_icon()
+            if self._tray_qicon.isNull():
                 # Fallback to default icon
-                icon = QIcon()
-                print(f"WARNING: Tray icon not found at {icon_path}")
+                print(f"WARNING: Tray icon not found at {path_manager.get_resource_file('icons/icon.ico')}")
             
-            self.tray_icon = QSystemTrayIcon(icon, self.app)
+            self.tray_icon = QSystemTrayIcon(self._tray_qicon, self.app)
             self.log("Setting up system tray...")
             
             # Icon already set in constructor above
             # Custom icon loaded from resources/icons/icon.ico
             
-            # Create menu
+            # Create menu - actions are built on first open (see _populate_tray_menu_once)
             menu = QMenu()
-            
-            # Settings action
-            settings_action = QAction("Settings", self.app)
-            settings_action.triggered.connect(self.show_settings)
-            menu.addAction(settings_action)
-            
-            menu.addSeparator()
-            
-            # Hotkeys toggle
-            self.toggle_hotkeys_action = QAction("Enable Hotkeys", self.app, checkable=True)
-            self.toggle_hotkeys_action.setChecked(self.hotkeys_enabled)
-            self.toggle_hotkeys_action.triggered.connect(self.toggle_hotkeys)
-            menu.addAction(self.toggle_hotkeys_action)
-            
-            menu.addSeparator()
-            
-            # Mode switch
-            mode_menu = menu.addMenu("Mode")
-            manual_action = QAction("Manual", self.app, checkable=True)
-            auto_action = QAction("Auto", self.app, checkable=True)
-            
-            current_mode = self.router.get_mode()
-            if current_mode == mode_router.DetectionMode.MANUAL:
-                manual_action.setChecked(True)
-            else:
-                auto_action.setChecked(True)
-            
-            manual_action.triggered.connect(lambda: self.switch_mode('manual'))
-            auto_action.triggered.connect(lambda: self.switch_mode('auto'))
-            
-            mode_menu.addAction(manual_action)
-            mode_menu.addAction(auto_action)
-            
-            # Special Character Interspacing toggle
-            special_char_action = QAction("Special Char Interspacing", self.app, checkable=True)
-            special_char_enabled = self.config.get('optimization', {}).get('special_char_interspacing', False)
-            special_char_action.setChecked(special_char_enabled)
-            special_char_action.triggered.connect(lambda checked: self.toggle_special_char(checked))
-            menu.addAction(special_char_action)
-            
-            # Fancy Text Style menu
-            style_menu = menu.addMenu("Fancy Text Style")
-            
-            styles = ['squared', 'bold', 'italic', 'bold_italic', 'sans_serif', 'circled', 'negative_squared', 'negative_circled']
-            style_names = {
-                'squared': 'Squared (🄵🅄🄲🄺)',
-                'bold': 'Bold (𝐟𝐮𝐜𝐤)',
-                'italic': 'Italic (𝑓𝑢𝑐𝑘)',
-                'bold_italic': 'Bold Italic (𝒇𝒖𝒄𝒌)',
-                'sans_serif': 'Sans-Serif (𝖿𝗎𝖼𝗄)',
-                'circled': 'Circled (ⓕⓤⓒⓚ)',
-                'negative_squared': 'Negative Squared (🅵🆄🅲🅺)',
-                'negative_circled': 'Negative Circled (🅕🅤🅒🅚)'
-            }
-            
-            current_style = self.config.get('optimization', {}).get('fancy_text_style', 'squared')
-            
-            for style in styles:
-                style_action = QAction(style_names[style], self.app, checkable=True)
-                if style == current_style:
-                    style_action.setChecked(True)
-                style_action.triggered.connect(lambda checked, s=style: self.change_fancy_style(s))
-                style_menu.addAction(style_action)
-            
-            menu.addSeparator()
-            
-            # Notifications menu
-            notif_menu = menu.addMenu("Notifications")
-
-            # Get current settings
-            notif_config = self.config.get('notifications', {})
-            enabled = notif_config.get('enabled', True)
-            show_clean = notif_config.get('show_clean_messages', True)
-            show_optimized = notif_config.get('show_optimized_messages', True)
-
-            # Enable/Disable all notifications
-            self.notif_enabled_action = QAction("Enable Notifications", self.app, checkable=True)
-            self.notif_enabled_action.setChecked(enabled)
-            self.notif_enabled_action.triggered.connect(lambda checked: self.toggle_notifications('enabled', checked))
-            notif_menu.addAction(self.notif_enabled_action)
-
-            notif_menu.addSeparator()
-
-            # Show clean messages
-            self.notif_clean_action = QAction("Show Clean Message Popups", self.app, checkable=True)
-            self.notif_clean_action.setChecked(show_clean)
-            self.notif_clean_action.triggered.connect(lambda checked: self.toggle_notifications('show_clean_messages', checked))
-            notif_menu.addAction(self.notif_clean_action)
-
-            # Show optimized messages
-            self.notif_optimized_action = QAction("Show Optimized Message Popups", self.app, checkable=True)
-            self.notif_optimized_action.setChecked(show_optimized)
-            self.notif_optimized_action.triggered.connect(lambda checked: self.toggle_notifications('show_optimized_messages', checked))
-            notif_menu.addAction(self.notif_optimized_action)
-
-            menu.addSeparator()
-            
-            # Max Sliding Window menu
-            window_menu = menu.addMenu("Max Sliding Window")
-            current_max_window = self.config.get('max_sliding_window', 3)
-            
-            window_sizes = [
-                (2, "2-word (Fast)"),
-                (3, "3-word (Default)"),
-                (4, "4-word"),
-                (5, "5-word (Comprehensive)")
-            ]
-            
-            for window_size, label in window_sizes:
-                window_action = QAction(label, self.app, checkable=True)
-                if window_size == current_max_window:
-                    window_action.setChecked(True)
-                window_action.triggered.connect(lambda checked, size=window_size: self.set_max_sliding_window(size))
-                window_menu.addAction(window_action)
-            
-            menu.addSeparator()
-            
-            # Stats action
-            stats_action = QAction("Show Stats", self.app)
-            stats_action.triggered.connect(self.show_stats)
-            menu.addAction(stats_action)
-            
-            menu.addSeparator()
-
-            # Debug console toggle (Windows only)
-            if sys.platform == 'win32':
-                console_action = QAction("Toggle Debug Console", self.app)
-                console_action.triggered.connect(self.toggle_console)
-                menu.addAction(console_action)
-            
-            menu.addSeparator()
-            
-            # Quit action
-            quit_action = QAction("Quit", self.app)
-            quit_action.triggered.connect(self.quit_app)
-            menu.addAction(quit_action)
+            menu.aboutToShow.connect(self._populate_tray_menu_once)
+            self._tray_menu = menu
+            self._tray_menu_populated = False
             
             self.tray_icon.setContextMenu(menu)
             
@@ -1274,14 +1654,10 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             self.tray_icon.activated.connect(self.on_tray_activated)
             
             # Show system tray notification with custom icon
-            icon_path = path_manager.get_resource_file('icons/icon.ico')
-            if os.path.exists(icon_path):
-                from PyQt5.QtGui import QIcon
-                custom_icon = QIcon(icon_path)
-                self.tray_icon.showMessage(
+            if not self._tray_qicon.isNull():
+                self._tray_notify(
                     "COCK IN OPERATION",
                     "Running in your system tray. Right click for settings.",
-                    custom_icon,  # Use custom icon instead of QSystemTrayIcon.Information
                     3000  # 3 seconds
                 )
             else:
@@ -1299,15 +1675,208 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             print(f"WARNING: Could not create system tray icon: {e}")
             return False
     
+    def _tray_notify(self, title, body, timeout=2000):
+        """
+        Show a tray balloon message with the cached app icon
+        
+        Args:
+            title: Message title
+            body: Message text
+            timeout: Display time in milliseconds
+        """
+        if self.tray_icon is None:
+            return
+        self.tray_icon.showMessage(title, body, self._tray_qicon, timeout)
+    
+    def _populate_tray_menu_once(self):
+        """Build the tray menu actions the first time the menu is opened"""
+        if self._tray_menu_populated:
+            return
+        self._tray_menu_populated = True
+        
+        menu = self._tray_menu
+        
+        # Settings action
+        settings_action = QAction("Settings", self.app)
+        settings_action.triggered.connect(self.show_settings)
+        menu.addAction(settings_action)
+        
+        menu.addSeparator()
+        
+        # Hotkeys toggle
+        self.toggle_hotkeys_action = QAction("Enable Hotkeys", self.app, checkable=True)
+        self.toggle_hotkeys_action.setChecked(self.hotkeys_enabled)
+        self.toggle_hotkeys_action.triggered.connect(self.toggle_hotkeys)
+        menu.addAction(self.toggle_hotkeys_action)
+        
+        menu.addSeparator()
+        
+        # Mode switch
+        mode_menu = menu.addMenu("Mode")
+        manual_action = QAction("Manual", self.app, checkable=True)
+        auto_action = QAction("Auto", self.app, checkable=True)
+        
+        is_manual = self.router.get_mode() is _MODE_MANUAL
+        manual_action.setChecked(is_manual)
+        auto_action.setChecked(not is_manual)
+        
+        manual_action.setData('manual')
+        auto_action.setData('auto')
+        self._mode_actions = [manual_action, auto_action]
+        
+        # One exclusive group per submenu, dispatching on action.data()
+        mode_group = QActionGroup(mode_menu)
+        mode_group.addAction(manual_action)
+        mode_group.addAction(auto_action)
+        mode_group.triggered.connect(self._on_mode_action)
+        
+        mode_menu.addAction(manual_action)
+        mode_menu.addAction(auto_action)
+        
+        # Special Character Interspacing toggle
+        special_char_action = QAction("Special Char Interspacing", self.app, checkable=True)
+        special_char_enabled = self.config.get('optimization', {}).get('special_char_interspacing', False)
+        special_char_action.setChecked(special_char_enabled)
+        special_char_action.triggered.connect(lambda checked: self.toggle_special_char(checked))
+        menu.addAction(special_char_action)
+        
+        # Fancy Text Style menu (actions built on first open)
+        self._style_menu = menu.addMenu("Fancy Text Style")
+        self._style_menu.aboutToShow.connect(self._populate_style_menu)
+        
+        menu.addSeparator()
+        
+        # Notifications menu
+        notif_menu = menu.addMenu("Notifications")
+
+        # Get current settings
+        notif_config = self.config.get('notifications', {})
+        enabled = notif_config.get('enabled', True)
+        show_clean = notif_config.get('show_clean_messages', True)
+        show_optimized = notif_config.get('show_optimized_messages', True)
+
+        # Enable/Disable all notifications
+        self.notif_enabled_action = QAction("Enable Notifications", self.app, checkable=True)
+        self.notif_enabled_action.setChecked(enabled)
+        self.notif_enabled_action.triggered.connect(lambda checked: self.toggle_notifications('enabled', checked))
+        notif_menu.addAction(self.notif_enabled_action)
+
+        notif_menu.addSeparator()
+
+        # Show clean messages
+        self.notif_clean_action = QAction("Show Clean Message Popups", self.app, checkable=True)
+        self.notif_clean_action.setChecked(show_clean)
+        self.notif_clean_action.triggered.connect(lambda checked: self.toggle_notifications('show_clean_messages', checked))
+        notif_menu.addAction(self.notif_clean_action)
+
+        # Show optimized messages
+        self.notif_optimized_action = QAction("Show Optimized Message Popups", self.app, checkable=True)
+        self.notif_optimized_action.setChecked(show_optimized)
+        self.notif_optimized_action.triggered.connect(lambda checked: self.toggle_notifications('show_optimized_messages', checked))
+        notif_menu.addAction(self.notif_optimized_action)
+
+        menu.addSeparator()
+        
+        # Max Sliding Window menu (actions built on first open)
+        self._window_menu = menu.addMenu("Max Sliding Window")
+        self._window_menu.aboutToShow.connect(self._populate_window_menu)
+        
+        menu.addSeparator()
+        
+        # Stats action
+        stats_action = QAction("Show Stats", self.app)
+        stats_action.triggered.connect(self.show_stats)
+        menu.addAction(stats_action)
+        
+        menu.addSeparator()
+
+        # Debug console toggle (Windows only)
+        if sys.platform == 'win32':
+            console_action = QAction("Toggle Debug Console", self.app)
+            console_action.triggered.connect(self.toggle_console)
+            menu.addAction(console_action)
+        
+        menu.addSeparator()
+        
+        # Quit action
+        quit_action = QAction("Quit", self.app)
+        quit_action.triggered.connect(self.quit_app)
+        menu.addAction(quit_action)
+        
+        self.log("Tray menu built")
+    
+    def _populate_style_menu(self):
+        """Build the Fancy Text Style submenu actions on first open"""
+        self._style_menu.aboutToShow.disconnect(self._populate_style_menu)
+        
+        # Read at show time so the checkmark reflects the current config
+        current_style = self.config.get('optimization', {}).get('fancy_text_style', 'squared')
+        
+        style_group = QActionGroup(self._style_menu)
+        style_group.triggered.connect(self._on_style_action)
+        
+        for style, name in TRAY_STYLE_NAMES.items():
+            style_action = QAction(name, self.app, checkable=True)
+            if style == current_style:
+                style_action.setChecked(True)
+            style_action.setData(style)
+            style_group.addAction(style_action)
+            self._style_menu.addAction(style_action)
+            self._style_actions.append(style_action)
+    
+    def _populate_window_menu(self):
+        """Build the Max Sliding Window submenu actions on first open"""
+        self._window_menu.aboutToShow.disconnect(self._populate_window_menu)
+        
+        current_max_window = self.config.get('max_sliding_window', 3)
+        
+        window_group = QActionGroup(self._window_menu)
+        window_group.triggered.connect(self._on_window_action)
+        
+        for window_size, label in TRAY_WINDOW_SIZES:
+            window_action = QAction(label, self.app, checkable=True)
+            if window_size == current_max_window:
+                window_action.setChecked(True)
+            window_action.setData(window_size)
+            window_group.addAction(window_action)
+            self._window_menu.addAction(window_action)
+            self._window_actions.append(window_action)
+    
+    def _on_mode_action(self, action):
+        """Mode submenu group handler (action.data() is the mode name)"""
+        self.switch_mode(action.data())
+    
+    def _on_style_action(self, action):
+        """Fancy Text Style submenu group handler (action.data() is the style key)"""
+        self.change_fancy_style(action.data())
+    
+    def _on_window_action(self, action):
+        """Max Sliding Window submenu group handler (action.data() is the window size)"""
+        self.set_max_sliding_window(action.data())
+    
     def apply_settings_live(self):
-        """Apply settings without restart"""
+        """
+        Apply settings without restart
+        
+        Holds the router lock throughout, so a hotkey worker never sees the
+        detector, optimizer and config half-replaced.
+        """
+        with self._router_lock:
+            self._apply_settings_live()
+    
+    def _apply_settings_live(self):
+        """Apply settings without restart (caller holds the router lock)"""
         
         # Store old values for comparison
         old_sliding_window = self.config.get('max_sliding_window', 3)
-        old_whitelist_size = len(self.wl_manager.get_whitelist())
+        
+        # Write any pending tray-menu change before re-reading the file
+        self._flush_config()
         
         # Update config
         self.config = self.config_loader.load()
+        self._last_saved_config = copy.deepcopy(self.config)
+        self._refresh_notification_cache()
         
         # Check what changed
         needs_detector_rebuild = False
@@ -1315,15 +1884,13 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         # Check 1: Sliding window changed
         new_sliding_window = self.config.get('max_sliding_window', 3)
         if new_sliding_window != old_sliding_window:
-            self.log(f"Sliding window changed: {old_sliding_window} -> {new_sliding_window}")
+            self.log("Sliding window changed: %s -> %s", old_sliding_window, new_sliding_window)
             needs_detector_rebuild = True
         
         # Check 2: Whitelist changed (from Settings Save button or tray)
-        # Reload whitelist from file
-        self.wl_manager._load_whitelist()
-        new_whitelist_size = len(self.wl_manager.get_whitelist())
-        if new_whitelist_size != old_whitelist_size:
-            self.log(f"Whitelist changed: {old_whitelist_size} -> {new_whitelist_size} entries")
+        # Reload whitelist from file only if it was modified since the last load
+        if self.wl_manager.reload_if_changed():
+            self.log("Whitelist file changed, reloaded")
             needs_detector_rebuild = True
         
         # Update optimizer settings (these don't need detector rebuild)
@@ -1336,14 +1903,12 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         
         # Update hotkey if changed
         new_hotkey = self.config.get('hotkey', 'ctrl+shift+v')
-        if isinstance(new_hotkey, dict):
-            new_hotkey = new_hotkey.get('combo', 'ctrl+shift+v')
         
-        if hasattr(self, 'hotkey') and self.hotkey:
+        if self.hotkey:
             old_hotkey = self.hotkey.get_hotkey()
             if old_hotkey != new_hotkey:
                 if self.hotkey.change_hotkey(new_hotkey):
-                    self.log(f"Hotkey updated: {old_hotkey} -> {new_hotkey}")
+                    self.log("Hotkey updated: %s -> %s", old_hotkey, new_hotkey)
         
         # Rebuild detector only if necessary
         if needs_detector_rebuild:
@@ -1362,8 +1927,8 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         # Recreate overlays with new scale settings
         if PYQT5_AVAILABLE:
             # Get old scales
-            old_notification_scale = getattr(self, '_last_notification_scale', 1.0)
-            old_prompt_scale = getattr(self, '_last_prompt_scale', 1.0)
+            old_notification_scale = self._last_notification_scale
+            old_prompt_scale = self._last_prompt_scale
             
             # Get new scales
             new_notification_scale = self.config.get('ui', {}).get('notification_scale', 1.0)
@@ -1373,26 +1938,28 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             notification_scale_changed = abs(new_notification_scale - old_notification_scale) > 0.01
             prompt_scale_changed = abs(new_prompt_scale - old_prompt_scale) > 0.01
             
-            # Recreate manual overlay if prompt scale changed
-            if prompt_scale_changed and hasattr(self, 'manual_overlay'):
-                self.log(f"Prompt scale changed: {old_prompt_scale} → {new_prompt_scale}")
+            # Keep the overlay on the reloaded config (sound settings etc.)
+            if self.manual_overlay:
+                self.manual_overlay.config = self.config
+                
+                # Restyle in place if the theme changed (it's read once at construction)
+                new_theme = self.config.get('ui', {}).get('theme', 'dark')
+                if new_theme != self.manual_overlay.theme:
+                    self.log("Overlay theme changed: %s → %s", self.manual_overlay.theme, new_theme)
+                    try:
+                        self.manual_overlay.theme = new_theme
+                        self.manual_overlay.apply_theme()
+                    except Exception as e:
+                        print(f"Warning: Could not apply overlay theme: {e}")
+            
+            # Rescale manual overlay in place if prompt scale changed
+            if prompt_scale_changed and self.manual_overlay:
+                self.log("Prompt scale changed: %s → %s", old_prompt_scale, new_prompt_scale)
                 try:
-                    # Close old overlay if visible
-                    if self.manual_overlay and hasattr(self.manual_overlay, 'isVisible'):
-                        if self.manual_overlay.isVisible():
-                            self.manual_overlay.hide()
-                    
-                    # Recreate with new scale
-                    import overlay_manual
-                    self.manual_overlay = overlay_manual.ManualModeOverlay(self.config)
-                    
-                    # CRITICAL: Reconnect signals after recreating overlay
-                    self.manual_overlay.use_suggestion.connect(self.on_use_suggestion)
-                    self.manual_overlay.cancelled.connect(self.on_cancelled)
-                    
-                    self.log("✓ Manual overlay recreated with new scale (signals reconnected)")
+                    self.manual_overlay.apply_scale(new_prompt_scale)
+                    self.log("✓ Manual overlay rescaled")
                 except Exception as e:
-                    print(f"Warning: Could not recreate manual overlay: {e}")
+                    print(f"Warning: Could not rescale manual overlay: {e}")
             
             # Store current scales for next comparison
             self._last_notification_scale = new_notification_scale
@@ -1401,51 +1968,56 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         # Sync notification settings to tray menu
         self.sync_notification_settings()
         
+        # Point the router at the reloaded config (also drops cached results)
+        self.router.update_config(self.config)
+        
         self.log("✓ All settings applied successfully (no restart needed)")
 
     def sync_notification_settings(self):
         """Sync notification settings between config and tray menu"""
-        if not PYQT5_AVAILABLE or not hasattr(self, 'tray'):
+        if not PYQT5_AVAILABLE or self.tray_icon is None:
             self.log("Cannot sync: PyQt5 or tray not available")
             return
         
-        # Get current settings from config
-        notif_enabled = self.config.get('notifications', {}).get('enabled', True)
-        show_clean = self.config.get('notifications', {}).get('show_clean_messages', True)
-        show_optimized = self.config.get('notifications', {}).get('show_optimized_messages', True)
+        # Menu not opened yet - it is built from the current config on first open
+        if not self._tray_menu_populated:
+            return
         
-        self.log(f"[SYNC] Reading from config: enabled={notif_enabled}, clean={show_clean}, optimized={show_optimized}")
+        # Current settings (cached from config)
+        notif = self._notif
         
-        # Update action checkboxes directly using stored references
-        if hasattr(self, 'notif_enabled_action'):
-            self.notif_enabled_action.setChecked(notif_enabled)
-            self.log(f"[SYNC] Updated notif_enabled_action to {notif_enabled}")
-        else:
-            self.log("[SYNC] WARNING: notif_enabled_action not found!")
-            
-        if hasattr(self, 'notif_clean_action'):
-            self.notif_clean_action.setChecked(show_clean)
-            self.log(f"[SYNC] Updated notif_clean_action to {show_clean}")
-        else:
-            self.log("[SYNC] WARNING: notif_clean_action not found!")
-            
-        if hasattr(self, 'notif_optimized_action'):
-            self.notif_optimized_action.setChecked(show_optimized)
-            self.log(f"[SYNC] Updated notif_optimized_action to {show_optimized}")
-        else:
-            self.log("[SYNC] WARNING: notif_optimized_action not found!")
+        # Update the checkboxes in one batch with signals blocked, so toggled
+        # handlers don't fire and the menu repaints once
+        self._tray_menu.setUpdatesEnabled(False)
+        try:
+            for action, checked in (
+                (self.notif_enabled_action, notif.enabled),
+                (self.notif_clean_action, notif.show_clean),
+                (self.notif_optimized_action, notif.show_optimized),
+            ):
+                with QSignalBlocker(action):
+                    action.setChecked(checked)
+        finally:
+            self._tray_menu.setUpdatesEnabled(True)
         
-        self.log(f"Notification settings synced: enabled={notif_enabled}, clean={show_clean}, optimized={show_optimized}")
+        self.log("Notification settings synced: enabled=%s, clean=%s, optimized=%s",
+                 notif.enabled, notif.show_clean, notif.show_optimized)
 
     def on_tray_activated(self, reason):
         """Handle tray icon activation (click)"""
-        from PyQt5.QtWidgets import QSystemTrayIcon
-        
         # Single click or double click - open settings
         if reason in (QSystemTrayIcon.Trigger, QSystemTrayIcon.DoubleClick):
             self.show_settings()
         # Right click - context menu shows automatically
     
+    def _show_settings_after_splash(self):
+        """Auto-open settings at startup (splash finished signal or fallback timer, whichever is first)"""
+        if self._startup_settings_shown:
+            return
+        self._startup_settings_shown = True
+        self.splash = None  # No longer needed
+        self.show_settings()
+    
     def show_settings(self):
         """Show settings dialog (non-modal)"""
         self.log("show_settings() called")  # Debug
@@ -1457,11 +2029,13 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         try:
             self.log("Creating settings dialog...")
             
+            dialog = self.settings_dialog_instance
+            
             # If settings dialog already exists and is visible, just bring it to front
-            if hasattr(self, 'settings_dialog_instance') and self.settings_dialog_instance and self.settings_dialog_instance.isVisible():
+            if dialog and dialog.isVisible():
                 self.log("Settings dialog already visible, bringing to front")
-                self.settings_dialog_instance.raise_()
-                self.settings_dialog_instance.activateWindow()
+                dialog.raise_()
+                dialog.activateWindow()
                 return
             
             # Use stored filter stats or create empty dict
@@ -1470,7 +2044,16 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                 'load_time_ms': 0
             }
             
-            self.log(f"Filter stats: {filter_stats}")
+            self.log("Filter stats: %s", filter_stats)
+            
+            # Reuse the hidden dialog from a previous open - just reload its widgets
+            if dialog:
+                self.log("Reusing settings dialog...")
+                dialog.refresh(self.config, filter_stats)
+                dialog.show()
+                dialog.raise_()
+                dialog.activateWindow()
+                return
             
             # Create non-modal dialog with parent reference for update_checker and help_manager access
             self.log("Instantiating SettingsDialog...")
@@ -1493,8 +2076,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             self.log("Settings dialog shown successfully")
             
         except Exception as e:
-            self.log(f"ERROR: Settings dialog failed: {e}")
-            import traceback
+            self.log("ERROR: Settings dialog failed: %s", e)
             self.log(traceback.format_exc())  # Log full traceback to debug console
     
     def on_settings_saved(self, needs_restart):
@@ -1504,7 +2086,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         Args:
             needs_restart: True if filter file changed and user wants restart
         """
-        if not hasattr(self, 'settings_dialog_instance') or not self.settings_dialog_instance:
+        if not self.settings_dialog_instance:
             return
         
         try:
@@ -1516,23 +2098,24 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             self.config = self.settings_dialog_instance.get_config()
             
             # Save config using the loader
-            self.config_loader.save(self.config)
+            self.save_config()
             
             # Check if detection mode changed - update router and tray menu
             new_mode = self.config.get('detection_mode', 'manual')
-            self.log(f"[SETTINGS] Mode check: old='{old_mode}' (from router), new='{new_mode}' (from dialog)")
+            self.log("[SETTINGS] Mode check: old='%s' (from router), new='%s' (from dialog)", old_mode, new_mode)
             # Normalize to lowercase for comparison (Qt may capitalize display text)
             if old_mode.lower() != new_mode.lower():
-                self.log(f"Detection mode changed: {old_mode} -> {new_mode}")
-                new_mode_enum = mode_router.DetectionMode.MANUAL if new_mode.lower() == 'manual' else mode_router.DetectionMode.AUTO
-                self.router.switch_mode(new_mode_enum)
-                self.log(f"[SETTINGS] Router mode switched to {new_mode_enum}")
+                self.log("Detection mode changed: %s -> %s", old_mode, new_mode)
+                new_mode_enum = _MODE_MANUAL if new_mode.lower() == 'manual' else _MODE_AUTO
+                with self._router_lock:
+                    self.router.switch_mode(new_mode_enum)
+                self.log("[SETTINGS] Router mode switched to %s", new_mode_enum)
                 # Update tray menu checkboxes
-                if hasattr(self, 'tray_icon') and self.tray_icon:
+                if self.tray_icon:
                     self.update_tray_menu_checkboxes()
                     self.log("[SETTINGS] Tray menu checkboxes updated")
             else:
-                self.log(f"[SETTINGS] Mode unchanged, skipping update")
+                self.log("[SETTINGS] Mode unchanged, skipping update")
             
             # Apply settings live (without restart)
             self.apply_settings_live()
@@ -1553,7 +2136,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
                 # Stop old hotkeys
                 if self.hotkey:
                     self.hotkey.stop()
-                if hasattr(self, 'force_hotkey') and self.force_hotkey:
+                if self.force_hotkey:
                     self.force_hotkey.stop()
                 
                 # Re-register new hotkeys
@@ -1571,147 +2154,101 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
         Args:
             result: QDialog.Accepted or QDialog.Rejected
         """
-        # Clean up reference
-        self.settings_dialog_instance = None
+        # Keep the (hidden) dialog for reuse - show_settings() refreshes it
+        self.log("Settings dialog closed (kept for reuse)")
     
     def switch_mode(self, mode_name):
         """Switch detection mode"""
-        self.log(f"Switching to {mode_name} mode")
+        if self.router.get_mode().value == mode_name:
+            return  # Already active - nothing to save or refresh
         
-        new_mode = mode_router.DetectionMode.MANUAL if mode_name == 'manual' else mode_router.DetectionMode.AUTO
-        self.router.switch_mode(new_mode)
+        self.log("Switching to %s mode", mode_name)
+        
+        new_mode = _MODE_MANUAL if mode_name == 'manual' else _MODE_AUTO
+        with self._router_lock:
+            self.router.switch_mode(new_mode)
         
         # Update config
         self.config['detection_mode'] = mode_name
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
         
         # Update tray menu checkboxes WITHOUT rebuilding everything
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             self.update_tray_menu_checkboxes()
             self.log("Tray menu updated")
         
         # Update settings dialog if it's open
-        if hasattr(self, 'settings_dialog_instance') and self.settings_dialog_instance and self.settings_dialog_instance.isVisible():
+        if self.settings_dialog_instance and self.settings_dialog_instance.isVisible():
             self.settings_dialog_instance.update_mode_display(mode_name)
             self.log("Settings dialog mode updated")
     
     def update_tray_menu_checkboxes(self):
-            """Update tray menu checkboxes to reflect current settings (without rebuilding)"""
-            if not hasattr(self, 'tray_icon') or not self.tray_icon:
-                return
+        """Update tray menu checkboxes to reflect current settings (without rebuilding)"""
+        if not self.tray_icon:
+            return
+        
+        try:
+            # Get current settings
+            current_mode = self.router.get_mode().value
+            current_style = self.config.get('optimization', {}).get('fancy_text_style', 'squared')
+            current_max_window = self.config.get('max_sliding_window', 3)
             
-            try:
-                # Get the context menu
-                menu = self.tray_icon.contextMenu()
-                if not menu:
-                    return
-                
-                # Get current settings
-                current_mode = self.router.get_mode()
-                current_style = self.config.get('optimization', {}).get('fancy_text_style', 'squared')
-                current_max_window = self.config.get('max_sliding_window', 3)
-                
-                # Update all submenus
-                for action in menu.actions():
-                    if not action.menu():
-                        continue
-                    
-                    submenu = action.menu()
-                    submenu_text = action.text()
+            # Each action carries its setting value in data() (set when the menu is built;
+            # the lists stay empty until the corresponding menu is first opened).
+            # Signals are left unblocked: the QActionGroups track the checked action
+            # through them, and setChecked() doesn't emit the groups' triggered signal.
+            for actions, current in (
+                (self._mode_actions, current_mode),
+                (self._style_actions, current_style),
+                (self._window_actions, current_max_window),
+            ):
+                for action in actions:
+                    action.setChecked(action.data() == current)
                     
-                    # Update Mode submenu
-                    if submenu_text == "Mode":
-                        for mode_action in submenu.actions():
-                            if mode_action.text() == "Manual":
-                                mode_action.setChecked(current_mode == mode_router.DetectionMode.MANUAL)
-                            elif mode_action.text() == "Auto":
-                                mode_action.setChecked(current_mode == mode_router.DetectionMode.AUTO)
-                    
-                    # Update Fancy Text Style submenu
-                    elif submenu_text == "Fancy Text Style":
-                        for style_action in submenu.actions():
-                            # Extract style name from action text (e.g., "Squared (🄵🅄🄲🄺)" -> "squared")
-                            action_text = style_action.text().lower()
-                            
-                            # Check against all style names
-                            if "squared" in action_text and "negative" not in action_text:
-                                style_action.setChecked(current_style == 'squared')
-                            elif "bold italic" in action_text:
-                                style_action.setChecked(current_style == 'bold_italic')
-                            elif "bold" in action_text and "italic" not in action_text:
-                                style_action.setChecked(current_style == 'bold')
-                            elif "italic" in action_text and "bold" not in action_text:
-                                style_action.setChecked(current_style == 'italic')
-                            elif "sans-serif" in action_text or "sans serif" in action_text:
-                                style_action.setChecked(current_style == 'sans_serif')
-                            elif "circled" in action_text and "negative" not in action_text:
-                                style_action.setChecked(current_style == 'circled')
-                            elif "negative squared" in action_text:
-                                style_action.setChecked(current_style == 'negative_squared')
-                            elif "negative circled" in action_text:
-                                style_action.setChecked(current_style == 'negative_circled')
-                    
-                    # Update Max Sliding Window submenu
-                    elif submenu_text == "Max Sliding Window":
-                        for window_action in submenu.actions():
-                            action_text = window_action.text()
-                            
-                            # Extract window size from text (e.g., "3-word (Default)" -> 3)
-                            if "2-word" in action_text or "2 word" in action_text:
-                                window_action.setChecked(current_max_window == 2)
-                            elif "3-word" in action_text or "3 word" in action_text:
-                                window_action.setChecked(current_max_window == 3)
-                            elif "4-word" in action_text or "4 word" in action_text:
-                                window_action.setChecked(current_max_window == 4)
-                            elif "5-word" in action_text or "5 word" in action_text:
-                                window_action.setChecked(current_max_window == 5)
-                        
-            except Exception as e:
-                self.log(f"Failed to update tray menu checkboxes: {e}")
+        except Exception as e:
+            self.log("Failed to update tray menu checkboxes: %s", e)
 
     def change_fancy_style(self, style):
         """Change fancy text style"""
-        self.log(f"Changing fancy text style to: {style}")
+        if self.config.get('optimization', {}).get('fancy_text_style') == style:
+            return
+        
+        self.log("Changing fancy text style to: %s", style)
         
         # Update config
         if 'optimization' not in self.config:
             self.config['optimization'] = {}
         self.config['optimization']['fancy_text_style'] = style
-        self.config_loader.save(self.config)
-        
-        # Recreate fancy text converter with new style
-        self.fancy = fancy_text.FancyTextConverter(default_style=style)
-        
-        # Recreate optimizer with new fancy converter
-        self.optimizer = message_optimizer.MessageOptimizer(
-            self.detector,
-            self.leet,
-            self.fancy,
-            self.shorthand,
-            self.config
-        )
+        self._mark_config_dirty()
+        
+        # Switch style in place - the optimizer reads the style from its config,
+        # which may be a stale dict after apply_settings_live() reloaded ours
+        with self._router_lock:
+            self.fancy.set_style(style)
+            self.optimizer.config = self.config
 
         # Update tray menu checkboxes
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             self.update_tray_menu_checkboxes()
         
-        # Update router with new optimizer
-        self.router.optimizer = self.optimizer
-        
-        self.log(f"Fancy text style changed to {style}")
+        self.log("Fancy text style changed to %s", style)
     
     def toggle_special_char(self, enabled: bool):
         """Toggle special character interspacing"""
-        self.log(f"Special character interspacing {'enabled' if enabled else 'disabled'}")
+        if self.config.get('optimization', {}).get('special_char_interspacing') == enabled:
+            return
+        
+        self.log("Special character interspacing %s", 'enabled' if enabled else 'disabled')
         
         # Update config
         if 'optimization' not in self.config:
             self.config['optimization'] = {}
         self.config['optimization']['special_char_interspacing'] = enabled
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
         
         # Update optimizer setting
-        self.optimizer.enable_special_char = enabled
+        with self._router_lock:
+            self.optimizer.enable_special_char = enabled
         
         # Show notification
         if self.config.get('notifications', {}).get('enabled', True):
@@ -1727,42 +2264,52 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
     
     def toggle_notifications(self, setting: str, enabled: bool):
         """Toggle notification settings"""
-        self.log(f"Notification setting '{setting}' = {enabled}")
+        if self.config.get('notifications', {}).get(setting) == enabled:
+            return
+        
+        self.log("Notification setting '%s' = %s", setting, enabled)
         
         # Update config
         if 'notifications' not in self.config:
             self.config['notifications'] = {}
         self.config['notifications'][setting] = enabled
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
 
         # Sync to ensure tray menu and settings dialog stay in sync
         self.sync_notification_settings()
     
     def set_notification_duration(self, duration_ms: int):
         """Set notification popup duration"""
-        self.log(f"Notification duration set to {duration_ms}ms")
+        if self.config.get('notifications', {}).get('duration_ms') == duration_ms:
+            return
+        
+        self.log("Notification duration set to %sms", duration_ms)
         
         # Update config
         if 'notifications' not in self.config:
             self.config['notifications'] = {}
         self.config['notifications']['duration_ms'] = duration_ms
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
     
     def set_byte_limit(self, limit: Optional[int]):
         """Set message byte limit"""
+        if self.config.get('byte_limit') == (limit if limit is not None else 9999):
+            return
+        
         if limit is None:
             self.log("Byte limit disabled")
             limit_str = "disabled"
         else:
-            self.log(f"Byte limit set to {limit} bytes")
+            self.log("Byte limit set to %s bytes", limit)
             limit_str = f"{limit} bytes"
         
         # Update config
         self.config['byte_limit'] = limit if limit is not None else 9999
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
         
         # Update optimizer
-        self.optimizer.byte_limit = self.config['byte_limit']
+        with self._router_lock:
+            self.optimizer.byte_limit = self.config['byte_limit']
         
         # Show notification
         if self.config.get('notifications', {}).get('enabled', True):
@@ -1770,16 +2317,19 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
     
     def set_character_limit(self, limit: Optional[int]):
         """Set message character limit"""
+        if self.config.get('character_limit') == (limit if limit is not None else 9999):
+            return
+        
         if limit is None:
             self.log("Character limit disabled")
             limit_str = "disabled"
         else:
-            self.log(f"Character limit set to {limit} characters")
+            self.log("Character limit set to %s characters", limit)
             limit_str = f"{limit} characters"
         
         # Update config
         self.config['character_limit'] = limit if limit is not None else 9999
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
         
         # Show notification
         if self.config.get('notifications', {}).get('enabled', True):
@@ -1787,15 +2337,19 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
     
     def set_max_sliding_window(self, window_size: int):
         """Set maximum sliding window size for detection"""
-        self.log(f"Max sliding window set to {window_size}-word")
+        if self.config.get('max_sliding_window') == window_size:
+            return  # Re-clicking the current size: no save, notification or refresh
+        
+        self.log("Max sliding window set to %s-word", window_size)
         
         # Update config
         self.config['max_sliding_window'] = window_size
-        self.config_loader.save(self.config)
+        self._mark_config_dirty()
         
         # Update detector (need to rebuild pattern cache if detector exists)
-        if hasattr(self, 'detector') and self.detector:
-            self.detector.config['max_sliding_window'] = window_size
+        if self.detector:
+            with self._router_lock:
+                self.detector.config['max_sliding_window'] = window_size
         
         # Show notification
         if self.config.get('notifications', {}).get('enabled', True):
@@ -1805,7 +2359,7 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
             )
 
         # Update tray menu checkboxes
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             self.update_tray_menu_checkboxes()
     
     def show_stats(self):
@@ -1840,18 +2394,25 @@ class COCK(QObject if PYQT5_AVAILABLE else object):
     def get_stats_text(self):
         """Get statistics as text"""
         
-        stats = f"""COCK Profanity Processor Statistics
-
-Detection:
-• Mode: {self.router.get_mode().value}
-• Whitelist size: {len(self.wl_manager.get_whitelist())}
-
-Optimization:
-• Leet-speak: {'✓' if self.config.get('optimization', {}).get('leet_speak', True) else '✗'}
-• Fancy Unicode: {'✓' if self.config.get('optimization', {}).get('fancy_unicode', True) else '✗'}
-• Shorthand: {'✓' if self.config.get('optimization', {}).get('shorthand', True) else '✗'}
-"""
-        return stats
+        opt = self.config.get('optimization', {})
+        
+        def tick(enabled):
+            return '✓' if enabled else '✗'
+        
+        lines = [
+            "COCK Profanity Processor Statistics",
+            "",
+            "Detection:",
+            f"• Mode: {self.router.get_mode().value}",
+            f"• Whitelist size: {len(self.wl_manager.get_whitelist())}",
+            "",
+            "Optimization:",
+            f"• Leet-speak: {tick(opt.get('leet_speak', True))}",
+            f"• Fancy Unicode: {tick(opt.get('fancy_unicode', True))}",
+            f"• Shorthand: {tick(opt.get('shorthand', True))}",
+            "",
+        ]
+        return "\n".join(lines)
     
     def export_filter_list(self):
         """Export loaded filter list to a text file"""
@@ -1861,7 +2422,7 @@ Optimization:
         
         try:
             # Check if filter loader exists
-            if not hasattr(self, 'filter_loader') or not self.filter_loader:
+            if not self.filter_loader:
                 QMessageBox.warning(
                     None,
                     "Export Failed",
@@ -1870,7 +2431,7 @@ Optimization:
                 return
             
             # Get filter words from filter loader
-            if not hasattr(self.filter_loader, 'filter_words') or not self.filter_loader.filter_words:
+            if not self.filter_loader.filter_words:
                 QMessageBox.warning(
                     None,
                     "Export Failed",
@@ -1879,7 +2440,6 @@ Optimization:
                 return
             
             # Open file dialog
-            from PyQt5.QtWidgets import QFileDialog
             filename, _ = QFileDialog.getSaveFileName(
                 None,
                 "Export Filter List",
@@ -1891,62 +2451,112 @@ Optimization:
                 # User cancelled
                 return
             
-            # Sort words alphabetically for easier reading
-            sorted_words = sorted(self.filter_loader.filter_words)
-            
-            # Write to file
-            with open(filename, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(f"# Exported Filter List\n")
-                f.write(f"# Date: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Total words: {len(sorted_words)}\n")
-                f.write(f"# Original file: {self.filter_stats.get('file_path', 'Unknown')}\n")
-                f.write(f"# Includes Latin + diacriticals (e.g., Coño, café, Scheiße)\n")
-                f.write(f"# Excludes: Pure CJK, emoji, Cyrillic, Arabic\n")
-                f.write(f"#\n")
-                f.write(f"# Format: One word per line (sorted alphabetically)\n")
-                f.write(f"#\n\n")
-                
-                # Write words
-                for word in sorted_words:
-                    f.write(f"{word}\n")
-            
-            self.log(f"Exported {len(sorted_words)} filter words to: {filename}")
+            # Sort + write on a pool thread; _on_export_finished reports the result.
+            # The word set is copied here so a filter reload can't race the sort.
+            worker = ExportWorker(
+                self,
+                filename,
+                list(self.filter_loader.filter_words),
+                self.filter_stats.get('file_path', 'Unknown')
+            )
+            QThreadPool.globalInstance().start(worker)
             
-            # Show success message
-            QMessageBox.information(
+        except Exception as e:
+            self.log("ERROR: Export failed: %s", e)
+            traceback.print_exc()
+            QMessageBox.critical(
                 None,
-                "Export Successful",
-                f"Exported {len(sorted_words):,} filter words to:\n\n{filename}\n\n"
-                f"You can now search this file to verify what's in the loaded filter.\n\n"
-                f"Tip: Search for 'coño' (lowercase) to check if it was loaded."
+                "Export Failed",
+                f"Failed to export filter list:\n\n{str(e)}"
             )
+    
+    def _write_filter_export(self, filename, words, source_path):
+        """
+        Sort and write an exported filter list (runs on a pool thread)
+        
+        Args:
+            filename: Destination file
+            words: Filter words to export
+            source_path: Original filter file path (for the header)
+        
+        Returns:
+            tuple: (filename, word count, error message or None)
+        """
+        try:
+            # Sort words alphabetically for easier reading
+            sorted_words = sorted(words)
+            
+            count = len(sorted_words)
+            header = "".join([
+                "# Exported Filter List\n",
+                f"# Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"# Total words: {count}\n",
+                f"# Original file: {source_path}\n",
+                "# Includes Latin + diacriticals (e.g., Coño, café, Scheiße)\n",
+                "# Excludes: Pure CJK, emoji, Cyrillic, Arabic\n",
+                "#\n",
+                "# Format: One word per line (sorted alphabetically)\n",
+                "#\n\n",
+            ])
+            
+            # Write to file: header, then all words in one joined write
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(header)
+                f.write("\n".join(sorted_words) + "\n")
             
+            return filename, count, None
         except Exception as e:
-            self.log(f"ERROR: Export failed: {e}")
-            import traceback
             traceback.print_exc()
+            return filename, 0, str(e)
+    
+    def _on_export_finished(self, payload):
+        """
+        Report a finished filter export (main thread, via export_finished)
+        
+        Args:
+            payload: (filename, word count, error message or None)
+        """
+        filename, count, error = payload
+        
+        if error:
+            self.log("ERROR: Export failed: %s", error)
             QMessageBox.critical(
                 None,
                 "Export Failed",
-                f"Failed to export filter list:\n\n{str(e)}"
+                f"Failed to export filter list:\n\n{error}"
             )
+            return
+        
+        self.log("Exported %d filter words to: %s", count, filename)
+        
+        # Show success message
+        QMessageBox.information(
+            None,
+            "Export Successful",
+            f"Exported {count:,} filter words to:\n\n{filename}\n\n"
+            f"You can now search this file to verify what's in the loaded filter.\n\n"
+            f"Tip: Search for 'coño' (lowercase) to check if it was loaded."
+        )
     
     def quit_app(self):
         """Quit application"""
         self.log("Quitting application...")
         self.running = False
+        self._shutdown_event.set()  # Wakes the console-mode wait in run()
+        
+        # Write any debounced config changes before exiting
+        self._flush_config()
         
         # Stop hotkey listeners
         if self.hotkey:
             self.hotkey.stop()
-        if hasattr(self, 'force_hotkey') and self.force_hotkey:
+        if self.force_hotkey:
             self.force_hotkey.stop()
-        if hasattr(self, 'toggle_hotkey') and self.toggle_hotkey:
+        if self.toggle_hotkey:
             self.toggle_hotkey.stop()
         
         # Close debug window if open
-        if hasattr(self, 'debug_window') and self.debug_window:
+        if self.debug_window:
             self.debug_window.close()
         
         # Quit Qt application
@@ -1960,31 +2570,24 @@ Optimization:
         """Restart the application"""
         self.log("Restarting application...")
         
+        # Write any debounced config changes before restarting
+        self._flush_config()
+        
         # Stop hotkeys
         if self.hotkey:
             self.hotkey.stop()
-        if hasattr(self, 'force_hotkey') and self.force_hotkey:
+        if self.force_hotkey:
             self.force_hotkey.stop()
-        if hasattr(self, 'toggle_hotkey') and self.toggle_hotkey:
+        if self.toggle_hotkey:
             self.toggle_hotkey.stop()
         
         # Close Qt application if running
         if PYQT5_AVAILABLE and self.app:
             self.app.quit()
         
-        # Sanitize arguments to prevent command injection
-        safe_args = []
-        for arg in sys.argv:
-            if arg.endswith('.py') or arg in ['--debug', '--config']:
-                safe_args.append(arg)
-            elif arg.startswith('--config='):
-                config_path = arg.split('=', 1)[1]
-                if os.path.exists(config_path) and config_path.endswith('.json'):
-                    safe_args.append(arg)
-        
-        # Restart using Python
+        # Restart using Python (arguments were sanitized at startup)
         python = sys.executable
-        os.execl(python, python, *safe_args)
+        os.execv(python, [python, *self._safe_restart_args])
     
     def run(self):
         """Run the application"""
@@ -2008,10 +2611,8 @@ Optimization:
                 self.app.setQuitOnLastWindowClosed(False)  # Keep running in tray
 
                 # Set application-wide icon
-                icon_path = path_manager.get_resource_file('icons/icon.ico')
-                if os.path.exists(icon_path):
-                    from PyQt5.QtGui import QIcon
-                    self.app.setWindowIcon(QIcon(icon_path))
+                if not _app_icon().isNull():
+                    self.app.setWindowIcon(_app_icon())
                 
                 # Initialize UI components now that QApplication exists
                 self.init_ui()
@@ -2020,52 +2621,54 @@ Optimization:
                 self.setup_tray_icon()
                 
                 self.running = True
-                print("\n" + "="*50)
-                print("COCK Profanity Processor is running!")
-                print(f"Mode: {self.router.get_mode().value}")
-                
-                # Get hotkey string from config (handle both formats)
-                hotkey_config = self.config.get('hotkey', 'ctrl+shift+v')
-                if isinstance(hotkey_config, dict):
-                    hotkey_str = hotkey_config.get('combo', 'ctrl+shift+v')
+                # Startup banner, written in one call
+                print("\n".join([
+                    "",
+                    "="*50,
+                    "COCK Profanity Processor is running!",
+                    f"Mode: {self.router.get_mode().value}",
+                    f"Hotkey: {self.config.get('hotkey', 'ctrl+shift+v')}",
+                    "Right-click tray icon for options",
+                    "="*50 + "\n",
+                ]))
+
+                # Show settings window once the splash screen has faded out completely
+                if self.splash and not self.splash.is_finished:
+                    self.log("Auto-show settings scheduled for splash finish")
+                    self.splash.finished.connect(self._show_settings_after_splash)
+                    # Fallback in case the splash never reports finishing
+                    QTimer.singleShot(5000, self._show_settings_after_splash)
                 else:
-                    hotkey_str = hotkey_config
-                print(f"Hotkey: {hotkey_str}")
+                    self._show_settings_after_splash()
                 
-                print("Right-click tray icon for options")
-                print("="*50 + "\n")
-
-                # Show settings window after splash screen fades out completely
-                # Splash duration is 3000ms, so delay 3200ms to ensure fade is complete
-                self.log("Scheduling auto-show settings in 3200ms...")
-                QTimer.singleShot(3200, self.show_settings)
+                # Write any debounced config change on every way out of the event loop
+                self.app.aboutToQuit.connect(self._flush_config)
+                self.app.aboutToQuit.connect(self._release_notification_cache)
                 
                 # Run event loop
                 return self.app.exec_()
             else:
                 # Console mode
                 self.running = True
-                print("\n" + "="*50)
-                print("COCK Profanity Processor is running (console mode)")
-                
-                # Get hotkey string from config (handle both formats)
-                hotkey_config = self.config.get('hotkey', 'ctrl+shift+v')
-                if isinstance(hotkey_config, dict):
-                    hotkey_str = hotkey_config.get('combo', 'ctrl+shift+v')
-                else:
-                    hotkey_str = hotkey_config
-                print(f"Hotkey: {hotkey_str}")
+                print("\n".join([
+                    "",
+                    "="*50,
+                    "COCK Profanity Processor is running (console mode)",
+                    f"Hotkey: {self.config.get('hotkey', 'ctrl+shift+v')}",
+                    "Press Ctrl+C to quit",
+                    "="*50 + "\n",
+                ]))
                 
-                print("Press Ctrl+C to quit")
-                print("="*50 + "\n")
-                
-                # Keep running
+                # Keep running until quit_app() or Ctrl+C sets the shutdown event.
+                # Windows can't interrupt an untimed wait with Ctrl+C, so poll slowly there.
+                signal.signal(signal.SIGINT, lambda signum, frame: self._shutdown_event.set())
+                timeout = 1.0 if sys.platform == 'win32' else None
                 try:
-                    while self.running:
-                        import time
-                        time.sleep(0.1)
+                    while self.running and not self._shutdown_event.wait(timeout):
+                        pass
                 except KeyboardInterrupt:
-                    print("\nShutting down...")
+                    pass
+                print("\nShutting down...")
                 
                 return 0
             
@@ -2078,12 +2681,26 @@ Optimization:
 
 def main():
     """Main entry point"""
-    import sys
+    # Parse arguments first so --help exits before any heavy setup
+    parser = argparse.ArgumentParser(
+        description="Compliant Online Chat Kit"
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug output'
+    )
+    parser.add_argument(
+        '--config',
+        type=str,
+        help='Path to config file'
+    )
+    
+    args = parser.parse_args()
     
     # Check for single instance
     if not check_single_instance():
         if PYQT5_AVAILABLE:
-            from PyQt5.QtWidgets import QApplication, QMessageBox
             app = QApplication(sys.argv)
             QMessageBox.warning(
                 None,
@@ -2099,7 +2716,6 @@ def main():
     splash = None
     
     if PYQT5_AVAILABLE:
-        from PyQt5.QtWidgets import QApplication
         app = QApplication(sys.argv)
         app.setQuitOnLastWindowClosed(False)
         
@@ -2116,41 +2732,15 @@ def main():
             print(f"WARNING: Could not show splash screen: {e}")
             splash = None
     
-    # Load configuration (allow splash to animate)
-    if app:
-        app.processEvents()
-    
+    # Load configuration
     config_loader_instance = config_loader.ConfigLoader()
     config = config_loader_instance.load()
     
-    # Process events after loading config
-    if app:
-        app.processEvents()
-    
-    parser = argparse.ArgumentParser(
-        description="Compliant Online Chat Kit"
-    )
-    parser.add_argument(
-        '--debug',
-        action='store_true',
-        help='Enable debug output'
-    )
-    parser.add_argument(
-        '--config',
-        type=str,
-        help='Path to config file'
-    )
-    
-    args = parser.parse_args()
-    
-    # Process events before creating tool
-    if app:
-        app.processEvents()
-    
     # Create application instance, passing the app if we created one
-    tool = COCK(config_path=args.config, debug=args.debug, app=app)
+    tool = COCK(config_path=args.config, debug=args.debug, app=app, splash=splash)
     
-    # Process events after tool creation
+    # One event pump for everything queued during setup (splash animation etc.);
+    # the splash was already painted right after it was shown
     if app:
         app.processEvents()
     